@@ -8,6 +8,22 @@ import colorsys
 from collections import Counter
 import random
 import logging
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _hex_to_rgb_cached(hex_code):
+    """Parse a HEX string to an RGB tuple (memoized; the UI converts the same colors repeatedly)"""
+    hex_code = hex_code.lstrip('#')
+    if len(hex_code) == 3:
+        hex_code = ''.join([c*2 for c in hex_code])
+    return tuple(int(hex_code[i:i+2], 16) for i in (0, 2, 4))
+
+
+@lru_cache(maxsize=4096)
+def _rgb_to_hex_cached(r, g, b):
+    """Format RGB ints as a HEX string (memoized alongside _hex_to_rgb_cached)"""
+    return '#{:02x}{:02x}{:02x}'.format(r, g, b)
 
 
 class ColorPaletteGenerator:
@@ -25,7 +41,7 @@ class ColorPaletteGenerator:
             filtered_pixels = []
             for p in pixels:
                 r, g, b = p
-                lum = 0.299 * r + 0.587 * g + 0.114 * b
+                lum = (77 * r + 150 * g + 29 * b) >> 8  # integer Rec.601 luma
                 max_c = max(r, g, b)
                 min_c = min(r, g, b)
                 sat = 0 if max_c == 0 else (max_c - min_c) / max_c
@@ -149,15 +165,12 @@ class ColorPaletteGenerator:
 
     def hex_to_rgb(self, hex_code):
         """Convert HEX to RGB"""
-        hex_code = hex_code.lstrip('#')
-        if len(hex_code) == 3:
-            hex_code = ''.join([c*2 for c in hex_code])
-        return tuple(int(hex_code[i:i+2], 16) for i in (0, 2, 4))
+        return _hex_to_rgb_cached(hex_code)
     
     def rgb_to_hex(self, rgb):
         """Convert RGB to HEX"""
         if isinstance(rgb, tuple) or isinstance(rgb, list):
-            return '#{:02x}{:02x}{:02x}'.format(int(rgb[0]), int(rgb[1]), int(rgb[2]))
+            return _rgb_to_hex_cached(int(rgb[0]), int(rgb[1]), int(rgb[2]))
         return '#000000'
     
     def rgb_to_hsv(self, r, g, b):
@@ -40,13 +40,13 @@ class FileHandler:
     
     def __init__(self):
         self._fernet_key = _load_key()
+        self._fernet = Fernet(self._fernet_key)
         os.makedirs('data', exist_ok=True)
     
     def _encrypt_aes(self, data_string):
         """AES encryption"""
         try:
-            fernet = Fernet(self._fernet_key)
-            return fernet.encrypt(data_string.encode('utf-8'))
+            return self._fernet.encrypt(data_string.encode('utf-8'))
         except Exception as e:
             logging.error(f"Encryption error: {e}")
             raise
@@ -54,8 +54,7 @@ class FileHandler:
     def _decrypt_aes(self, encrypted_data):
         """AES decryption"""
         try:
-            fernet = Fernet(self._fernet_key)
-            return fernet.decrypt(encrypted_data).decode('utf-8')
+            return self._fernet.decrypt(encrypted_data).decode('utf-8')
         except Exception as e:
             logging.error(f"Decryption error: {e}")
             raise
@@ -78,20 +77,8 @@ class FileHandler:
                 with open(temp_path, 'wb') as f:
                     f.write(encrypted)
                 
-                if os.path.exists(path):
-                    backup_path = path + '.bak'
-                    if os.path.exists(backup_path):
-                        os.remove(backup_path)
-                    os.rename(path, backup_path)
-                
-                os.rename(temp_path, path)
-                
-                backup_path = path + '.bak'
-                if os.path.exists(backup_path):
-                    try:
-                        os.remove(backup_path)
-                    except Exception:
-                        pass
+                # Atomic on both POSIX and Windows, even if path already exists
+                os.replace(temp_path, path)
                         
             except Exception as write_error:
                 if os.path.exists(temp_path):
@@ -27,15 +27,16 @@ class ImageRecolorer:
     
     def sort_palette_by_brightness(self, palette_hex_colors):
         """Sort palette colors from brightest to darkest"""
-        color_brightness = []
-        for hex_color in palette_hex_colors:
-            rgb = self.hex_to_rgb(hex_color)
-            brightness = self.get_brightness(rgb)
-            color_brightness.append((hex_color, brightness))
+        if not palette_hex_colors:
+            return []
         
-        # Sort by brightness (descending - brightest first)
-        color_brightness.sort(key=lambda x: x[1], reverse=True)
-        return [color for color, _ in color_brightness]
+        # Perceived brightness for all colors in one (N, 3) @ (3,) product
+        rgbs = np.array([self.hex_to_rgb(c) for c in palette_hex_colors], dtype=np.float64)
+        brightness = rgbs @ np.array([0.299, 0.587, 0.114])
+        
+        # Sort by brightness (descending - brightest first, ties keep input order)
+        order = np.argsort(-brightness, kind='stable')
+        return [palette_hex_colors[i] for i in order]
     
     def apply_palette_to_pil_image(self, img: Image.Image, palette_hex_colors, blur_radius: float = 0.6) -> Image.Image:
         """Apply palette colors to an in-memory PIL image.
@@ -47,25 +48,27 @@ class ImageRecolorer:
             alpha = img.getchannel('A')
         rgb_img = img.convert('RGB')
 
-        gray = np.array(rgb_img.convert('L'))
+        gray_img = rgb_img.convert('L')
 
         sorted_palette = self.sort_palette_by_brightness(palette_hex_colors)
         num_colors = len(sorted_palette)
         if num_colors <= 0:
             return img.copy()
 
-        min_val = gray.min()
-        max_val = gray.max()
+        min_val, max_val = gray_img.getextrema()
 
+        # Zones depend only on the gray level, so build a 256-entry gray -> RGB
+        # table once; PIL then maps every pixel through it in C (point + merge)
         denom = float(max_val - min_val) if max_val != min_val else 1.0
-        zone_idx = np.floor(((gray.astype(np.float32) - float(min_val)) / denom) * num_colors).astype(np.int32)
+        levels = np.arange(256, dtype=np.float32)
+        zone_idx = np.floor(((levels - float(min_val)) / denom) * num_colors).astype(np.int32)
         zone_idx = np.clip(zone_idx, 0, num_colors - 1)
 
         zone_palette = [self.hex_to_rgb(sorted_palette[num_colors - 1 - i]) for i in range(num_colors)]
         zone_palette = np.array(zone_palette, dtype=np.uint8)
 
-        result = zone_palette[zone_idx]
-        result_img = Image.fromarray(result.astype('uint8'), 'RGB')
+        level_colors = zone_palette[zone_idx]
+        result_img = Image.merge('RGB', [gray_img.point(level_colors[:, ch].tolist()) for ch in range(3)])
 
         try:
             if blur_radius and float(blur_radius) > 0:
@@ -253,6 +253,7 @@ class LanguageManager:
         'tooltip_color_box': '왼쪽 클릭: 팔레트에 추가\n오른쪽 클릭: 기본 색상으로 설정',
         
         # Palette edit buttons
+        'sort_by_color_family': '색상군 정렬',
         'sort_by_hue': '색조 정렬',
         'sort_by_saturation': '채도 정렬',
         'sort_by_luminance': '밸류 정렬',
@@ -780,6 +781,7 @@ class LanguageManager:
         'tooltip_color_box': 'Left click: Add to palette\nRight click: Set as base color',
         
         # Palette edit buttons
+        'sort_by_color_family': 'Sort by Color Family',
         'sort_by_hue': 'Sort by Hue',
         'sort_by_saturation': 'Sort by Saturation',
         'sort_by_luminance': 'Sort by Luminance',
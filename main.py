@@ -9,17 +9,26 @@ Design System:
 - Font: Segoe UI / SF Pro Display style
 """
 
-from PIL import Image, ImageTk, ImageGrab, ImageDraw
+from PIL import Image, ImageDraw, ImageTk, ImageGrab
+import numpy as np
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox, colorchooser
 import os
+import mmap
 import tempfile
 import logging
+import logging.handlers
 import hashlib
+import re
 import colorsys
 import base64
+from collections import OrderedDict
+from types import SimpleNamespace
+from functools import lru_cache
+from itertools import islice
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 # Import new modules
 from color_generator import ColorPaletteGenerator
@@ -44,6 +53,15 @@ except ImportError:
     EMBEDDED_ICON_DATA = None
     UI_ICONS_AVAILABLE = False
 
+# Prefer orjson for workspace (de)serialization, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Import color adjuster if available
 try:
     from color_adjuster import apply_contrast, apply_warmth
@@ -75,10 +93,101 @@ CORNER_RADIUS = 10
 PADDING = 10
 FONT_FAMILY = "Segoe UI"
 
+# Encrypted file layout: magic header + 96-bit nonce + AES-GCM ciphertext/tag.
+# Files without the header are legacy Fernet tokens (base64 of version byte 0x80).
+_AEAD_MAGIC = b'PGF\x01'
+_AEAD_NONCE_SIZE = 12
+_FERNET_PREFIX = b'gAAAAA'
+
+# Derived from a fixed passphrase, so this key is deterministic and only obfuscates
+# files; real secrecy would need a per-user key (e.g. stored via keyring).
+_PGF_KEY = hashlib.sha256(b"ColorPaletteGenerator2025SecretKey").digest()
+
+# Process umask, read once at import (before any worker threads start) because
+# os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 # Configure CustomTkinter
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+
+def _json_dumps(obj):
+    """Serialize an object to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Sequences CTkScrollableFrame binds on the 'all' tag
+_CTK_SCROLL_SEQUENCES = (
+    '<MouseWheel>', '<Button-4>', '<Button-5>',
+    '<KeyPress-Shift_L>', '<KeyPress-Shift_R>', '<KeyRelease-Shift_L>', '<KeyRelease-Shift_R>',
+)
+
+_HEX_RE = re.compile(r'#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})')
+
+
+@lru_cache(maxsize=4096)
+def _canon_hex(hex_color):
+    """Canonical '#RRGGBB' form of a HEX color (unrecognized values pass through)"""
+    m = _HEX_RE.fullmatch(hex_color.strip())
+    if m is None:
+        return hex_color
+    h = m.group(1).upper()
+    if len(h) == 3:
+        h = ''.join(c * 2 for c in h)
+    return '#' + h
+
+
+def _canon_colors(colors):
+    """Canonicalize a list of HEX colors when it enters a saved palette"""
+    return [_canon_hex(c) if isinstance(c, str) else c for c in colors]
+
+
+@lru_cache(maxsize=4096)
+def _gray_hex(hex_color):
+    """Grayscale (luma) hex for a color, used by the palette 'value' view"""
+    h = hex_color.lstrip('#')
+    if len(h) == 3:
+        h = ''.join(c * 2 for c in h)
+    # One int() parse for the whole code, channels split out with shifts
+    n = int(h, 16)
+    v = (77 * (n >> 16) + 150 * ((n >> 8) & 0xFF) + 29 * (n & 0xFF)) >> 8
+    return f'#{v:02x}{v:02x}{v:02x}'
+
+
+def _hex_array(colors):
+    """Parse HEX colors into an (N, 3) uint8 array with a single fromhex call"""
+    digits = []
+    for c in colors:
+        h = c.lstrip('#')
+        digits.append(''.join(ch * 2 for ch in h) if len(h) == 3 else h)
+    return np.frombuffer(bytes.fromhex(''.join(digits)), dtype=np.uint8).reshape(-1, 3)
+
+
+def _hue_array(rgb):
+    """HSV/HLS hue in [0, 1) for a float (N, 3) RGB array (0 for grays, like colorsys)"""
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    mx = rgb.max(axis=1)
+    d = mx - rgb.min(axis=1)
+    safe_d = np.where(d == 0, 1.0, d)
+    h = np.select(
+        [mx == r, mx == g],
+        [(g - b) / safe_d, 2.0 + (b - r) / safe_d],
+        4.0 + (r - g) / safe_d
+    )
+    return np.where(d == 0, 0.0, (h / 6.0) % 1.0)
+
+
 # Global icon path for all windows
 _ICON_PATH = None
 
@@ -119,6 +228,28 @@ def set_window_icon(window):
         pass
 
 
+# Cached GetSystemMetrics handle (Windows only), resolved on first use
+_GET_SYSTEM_METRICS = None
+
+
+def _get_virtual_screen():
+    """Get virtual screen bounds (x, y, width, height) on Windows, else None"""
+    global _GET_SYSTEM_METRICS
+
+    if os.name != 'nt':
+        return None
+
+    if _GET_SYSTEM_METRICS is None:
+        import ctypes
+        fn = ctypes.windll.user32.GetSystemMetrics
+        fn.argtypes = [ctypes.c_int]
+        fn.restype = ctypes.c_int
+        _GET_SYSTEM_METRICS = fn
+
+    # SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN, SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN
+    return tuple(int(_GET_SYSTEM_METRICS(index)) for index in (76, 77, 78, 79))
+
+
 class ModernCard(ctk.CTkFrame):
     """A modern card component with subtle shadow effect"""
     def __init__(self, master, title=None, **kwargs):
@@ -212,6 +343,12 @@ class ColorSwatch(ctk.CTkFrame):
         if command:
             self.bind("<Button-1>", lambda e: command())
             self.configure(cursor="hand2")
+    
+    def set_color(self, color):
+        """Recolor the swatch in place"""
+        if color != self.color:
+            self.color = color
+            self.configure(fg_color=color)
 
 
 class PaletteApp(ctk.CTk):
@@ -231,6 +368,46 @@ class PaletteApp(ctk.CTk):
         current_lang = self.config_manager.get('language', 'ko')
         self.lang = LanguageManager(current_lang)
         
+        # UI strings used on hot render/event paths (language only changes on restart)
+        self._ui_text = SimpleNamespace(
+            palette_numbered=self.lang.get('palette_numbered').format,
+            colors_count=self.lang.get('colors_count').format,
+            empty_palette_msg=self.lang.get('empty_palette_msg'),
+            color_box_tooltip=self.lang.get('color_box_tooltip'),
+            custom_harmony_default_name=self.lang.get('custom_harmony_default_name'),
+            view_rgb=self.lang.get('view_rgb'),
+            view_value=self.lang.get('view_value'),
+            context_rename=self.lang.get('context_rename'),
+            context_edit_palette=self.lang.get('context_edit_palette'),
+            context_save_palette=self.lang.get('context_save_palette'),
+            context_export_txt=self.lang.get('context_export_txt'),
+            context_export_png=self.lang.get('context_export_png'),
+        )
+        
+        # Harmony scheme headers: full labels for a single palette, short ones for image mode
+        self._scheme_labels = {
+            'complementary': self.lang.get('complementary_label'),
+            'analogous': self.lang.get('analogous_label'),
+            'triadic': self.lang.get('triadic_label'),
+            'monochromatic': self.lang.get('monochromatic'),
+            'split_complementary': self.lang.get('split_complementary'),
+            'square': self.lang.get('square'),
+            'tetradic': self.lang.get('tetradic'),
+            'double_complementary': self.lang.get('double_complementary')
+        }
+        self._scheme_labels_short = {
+            'complementary': self.lang.get('complementary'),
+            'analogous': self.lang.get('analogous'),
+            'triadic': self.lang.get('triadic'),
+            'monochromatic': self.lang.get('monochromatic'),
+            'split_complementary': self.lang.get('split_complementary'),
+            'square': self.lang.get('square'),
+            'tetradic': self.lang.get('tetradic'),
+            'double_complementary': self.lang.get('double_complementary')
+        }
+        # Indented form used under each representative color in image mode
+        self._scheme_labels_indented = {k: f"  {v}" for k, v in self._scheme_labels_short.items()}
+        
         # Window configuration
         window_width = self.config_manager.get('window_width', 1100)
         window_height = self.config_manager.get('window_height', 700)
@@ -244,8 +421,10 @@ class PaletteApp(ctk.CTk):
         self.generator = ColorPaletteGenerator()
         self.image_path = None
         self._temp_screenshot = None
+        self._pending_region = None
         
         self.ai_recommender = None
+        self._ai_jobs = None  # queue feeding the daemon AI worker, created on first use
         self.ai_palettes = []
         self.ai_palette_offset = 0
         
@@ -254,12 +433,26 @@ class PaletteApp(ctk.CTk):
         self.current_file = None
         self.is_modified = False
         
+        # SHA-256 of the last payload written to current_file (skip no-op saves)
+        self._last_saved_hash = None
+        self._last_write_dir = None
+        
+        # Parsed recent files list (refreshed whenever it is written)
+        self._recent_cache = None
+        
+        # AES-GCM cipher for workspace files, built once and reused per call;
+        # the Fernet reader for pre-AES-GCM files is created on first use
+        self._aead = AESGCM(_PGF_KEY)
+        self._legacy_fernet = None
+        
         self.auto_save_enabled = self.config_manager.get('auto_save_enabled', True)
         self.auto_save_interval = self.config_manager.get('auto_save_interval', 300) * 1000
         self.auto_save_timer = None
         
-        # Recent colors storage
-        self.recent_colors = self.config_manager.get('recent_colors', []) or []
+        # Recent colors storage (ordered oldest -> newest; config keeps newest first)
+        self.recent_colors = OrderedDict.fromkeys(
+            reversed(self.config_manager.get('recent_colors', []) or [])
+        )
         try:
             self.max_recent_colors = int(self.config_manager.get('max_recent_colors', 50))
         except Exception:
@@ -267,17 +460,41 @@ class PaletteApp(ctk.CTk):
         self.max_recent_colors = max(1, min(100, self.max_recent_colors))
 
         if len(self.recent_colors) > self.max_recent_colors:
-            self.recent_colors = self.recent_colors[:self.max_recent_colors]
-            self.config_manager.set('recent_colors', self.recent_colors)
+            self._trim_recent_colors()
+            self.config_manager.set('recent_colors', list(reversed(self.recent_colors)))
             self.config_manager.save_config()
         
-        # Global tooltip tracker to prevent ghosting
-        self.active_tooltips = []
+        # Single shared tooltip window (created lazily, withdrawn when hidden)
+        self._shared_tooltip = None
+        self._shared_tooltip_visible = False
+        self._tooltip_pending_pos = None
+        self._tooltip_move_job = None
+        
+        # Color box handlers, shared by every box through its bindtags (see draw_color_box)
+        self.bind_class('ColorBox', '<Button-1>', self._on_color_box_left_click)
+        self.bind_class('ColorBox', '<Button-3>', self._on_color_box_right_click)
+        self.bind_class('ColorBox', '<Enter>', self._on_color_box_enter)
+        self.bind_class('ColorBox', '<Leave>', self._on_color_box_leave)
+        self.bind_class('ColorBox', '<Motion>', self._on_color_box_motion)
+        
+        # Color currently shown in the sidebar swatch (skip identical redraws)
+        self._swatch_hex = None
+        
+        # Reusable recent color swatches (first _recent_visible are packed)
+        self._recent_swatches = []
+        self._recent_visible = 0
+        self._recent_empty_label = None
+        self._recent_flush_pending = False
         
         # Load UI icons
         self._icons = {}
         self._load_ui_icons()
         
+        # Shared CTkFont objects keyed by (size, weight), created on first use
+        self._fonts = {}
+        # Pre-rendered color box swatch tiles keyed by (hex, width, height), LRU order
+        self._swatch_cache = OrderedDict()
+        
         self.setup_logging()
         self.log_action("Application started")
         
@@ -341,6 +558,39 @@ class PaletteApp(ctk.CTk):
         """Get a loaded CTkImage icon by name, or None if unavailable"""
         return self._icons.get(name)
 
+    def _msg(self, kind, title_key, body_key, **fmt):
+        """Show a messagebox ('info', 'warning' or 'error') from language keys"""
+        get = self.lang.get
+        body = get(body_key)
+        if fmt:
+            body = body.format(**fmt)
+        getattr(messagebox, 'show' + kind)(get(title_key), body)
+    
+    def _scope_scroll_bindings(self, dialog):
+        """Undo the global scroll bindings a dialog's CTkScrollableFrames add, once the dialog closes"""
+        # CTkScrollableFrame registers its wheel/shift handlers with bind_all(add="+")
+        # and never removes them, so each opened dialog would leave more handlers
+        # behind on every wheel event
+        saved = {seq: self.bind_class('all', seq) for seq in _CTK_SCROLL_SEQUENCES}
+        
+        def on_destroy(e):
+            if e.widget is dialog:
+                for seq, script in saved.items():
+                    try:
+                        self.tk.call('bind', 'all', seq, script)
+                    except Exception:
+                        pass
+        
+        dialog.bind('<Destroy>', on_destroy, add='+')
+    
+    def _get_font(self, size, weight="normal"):
+        """Get a shared CTkFont for the given size and weight"""
+        key = (size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(family=FONT_FAMILY, size=size, weight=weight)
+        return font
+
     def create_widgets(self):
         """Create the main UI layout with modern dashboard design"""
         
@@ -378,6 +628,16 @@ class PaletteApp(ctk.CTk):
         self._saved_counter = 0
         self._saved_selected = None
         
+        # Saved palette rows by index (reused across renders) and render coalescing
+        self._palette_widgets = {}
+        self._saved_render_pending = False
+        self._palette_ctx_menu = None
+        self._palette_ctx_idx = None
+        
+        # Color bars waiting for the next coalesced redraw pass
+        self._pending_palette_bars = {}
+        self._palette_bar_job = None
+        
         # Create initial saved palette
         name = self.lang.get('new_palette_numbered').format(i=self._saved_counter + 1)
         self._saved_counter += 1
@@ -721,6 +981,7 @@ class PaletteApp(ctk.CTk):
             orientation="horizontal"
         )
         self.recent_colors_frame.pack(fill="x", padx=15, pady=10)
+        self._bind_recent_colors_wheel()
         
         self.update_recent_colors_display()
     
@@ -828,55 +1089,101 @@ class PaletteApp(ctk.CTk):
     # ============== Color Swatch Update ==============
     def _update_color_swatch(self, hex_color):
         """Update the color swatch display"""
+        hex_upper = hex_color.upper()
+        if hex_upper == self._swatch_hex:
+            return
         try:
             self.color_swatch_frame.configure(fg_color=hex_color)
-            self.lbl_hex_value.configure(text=hex_color.upper())
+            self.lbl_hex_value.configure(text=hex_upper)
             
             rgb = self.generator.hex_to_rgb(hex_color)
             self.lbl_rgb_value.configure(text=f"RGB({rgb[0]}, {rgb[1]}, {rgb[2]})")
+            self._swatch_hex = hex_upper
         except Exception:
             pass
     
     # ============== Recent Colors ==============
     def add_to_recent_colors(self, hex_color):
         """Add a color to recent colors history"""
-        hex_color = hex_color.upper()
-        
-        if hex_color in self.recent_colors:
-            self.recent_colors.remove(hex_color)
+        hex_color = _canon_hex(hex_color)
         
-        self.recent_colors.insert(0, hex_color)
-        self.recent_colors = self.recent_colors[:self.max_recent_colors]
+        self.recent_colors[hex_color] = None
+        self.recent_colors.move_to_end(hex_color)
+        self._trim_recent_colors()
         
-        self.config_manager.set('recent_colors', self.recent_colors)
+        # Persist and redraw once per idle cycle, however many colors were added
+        if not self._recent_flush_pending:
+            self._recent_flush_pending = True
+            self.after_idle(self._flush_recent_colors)
+    
+    def _flush_recent_colors(self):
+        """Save recent colors to config and refresh the panel"""
+        self._recent_flush_pending = False
+        self.config_manager.set('recent_colors', list(reversed(self.recent_colors)))
         self.config_manager.save_config()
         
         self.update_recent_colors_display()
     
+    def _trim_recent_colors(self):
+        """Drop the oldest recent colors beyond the configured limit"""
+        while len(self.recent_colors) > self.max_recent_colors:
+            self.recent_colors.popitem(last=False)
+    
     def update_recent_colors_display(self):
         """Update the recent colors display panel"""
-        # Clear existing widgets
-        for widget in self.recent_colors_frame.winfo_children():
-            widget.destroy()
-        
-        if not self.recent_colors:
-            empty_label = ctk.CTkLabel(
-                self.recent_colors_frame,
-                text=self.lang.get('recent_colors_empty'),
-                font=ctk.CTkFont(family=FONT_FAMILY, size=10),
-                text_color=COLORS['text_muted']
-            )
-            empty_label.pack(side="left", padx=5)
+        # Swatches are pooled: recolor the visible ones, pack/hide the tail
+        swatches = self._recent_swatches
+        visible = self._recent_visible
+        shown = list(islice(reversed(self.recent_colors), 20))  # Show max 20
+        
+        if not shown:
+            for swatch in swatches[:visible]:
+                swatch.pack_forget()
+            self._recent_visible = 0
+            if self._recent_empty_label is None:
+                self._recent_empty_label = ctk.CTkLabel(
+                    self.recent_colors_frame,
+                    text=self.lang.get('recent_colors_empty'),
+                    font=ctk.CTkFont(family=FONT_FAMILY, size=10),
+                    text_color=COLORS['text_muted']
+                )
+            self._recent_empty_label.pack(side="left", padx=5)
             return
         
-        for hex_color in self.recent_colors[:20]:  # Show max 20
-            swatch = ColorSwatch(
-                self.recent_colors_frame,
-                color=hex_color,
-                size=32,
-                command=lambda c=hex_color: self._use_color(c)
-            )
-            swatch.pack(side="left", padx=2, pady=2)
+        if self._recent_empty_label is not None:
+            self._recent_empty_label.pack_forget()
+        
+        for i, hex_color in enumerate(shown):
+            if i < len(swatches):
+                swatch = swatches[i]
+                swatch.set_color(hex_color)
+            else:
+                swatch = ColorSwatch(self.recent_colors_frame, color=hex_color, size=32)
+                swatch.bind('<Button-1>', lambda e, s=swatch: self._use_color(s.color))
+                # Wheel handling comes from the shared class tag, not a per-swatch bind
+                swatch._canvas.bindtags(('RecentColorsWheel',) + swatch._canvas.bindtags())
+                swatch.configure(cursor="hand2")
+                swatches.append(swatch)
+            if i >= visible:
+                swatch.pack(side="left", padx=2, pady=2)
+        
+        for swatch in swatches[len(shown):visible]:
+            swatch.pack_forget()
+        self._recent_visible = len(shown)
+    
+    def _bind_recent_colors_wheel(self):
+        """Bind the Shift+wheel handler that scrolls the recent colors strip sideways (once)"""
+        scroll = self.recent_colors_frame._parent_canvas.xview_scroll
+        
+        def on_wheel(e, _scroll=scroll):
+            # Sign of the delta: macOS and precision touchpads send |delta| < 120
+            if e.delta:
+                _scroll(-1 if e.delta > 0 else 1, 'units')
+            return "break"
+        
+        # Shift+wheel only, as CustomTkinter does for horizontal scrollable frames
+        self.bind_class('RecentColorsWheel', '<Shift-MouseWheel>', on_wheel)
+        self.recent_colors_frame.bind('<Shift-MouseWheel>', on_wheel)
     
     def _use_color(self, hex_color):
         """Use a color from recent colors"""
@@ -889,7 +1196,7 @@ class PaletteApp(ctk.CTk):
         if not self.recent_colors:
             return
         
-        self.recent_colors = []
+        self.recent_colors.clear()
         self.config_manager.set('recent_colors', [])
         self.config_manager.save_config()
         self.update_recent_colors_display()
@@ -922,11 +1229,12 @@ class PaletteApp(ctk.CTk):
                 self._update_color_swatch(hex_color)
                 self.add_to_recent_colors(hex_color)
         except Exception as e:
-            messagebox.showerror(self.lang.get('error'), self.lang.get('msg_color_picker_failed').format(error=str(e)))
+            self._msg('error', 'error', 'msg_color_picker_failed', error=str(e))
 
     # ============== Image Selection ==============
     def select_image(self):
         """Select image with validation"""
+        self._pending_region = None
         if getattr(self, '_temp_screenshot', None):
             try:
                 os.unlink(self._temp_screenshot)
@@ -946,7 +1254,7 @@ class PaletteApp(ctk.CTk):
         
         try:
             if not os.path.exists(path):
-                messagebox.showerror(self.lang.get('error'), self.lang.get('msg_file_not_found'))
+                self._msg('error', 'error', 'msg_file_not_found')
                 return
             
             file_size = os.path.getsize(path)
@@ -982,7 +1290,7 @@ class PaletteApp(ctk.CTk):
             self.extracted_colors = []
             
         except Exception as e:
-            messagebox.showerror(self.lang.get('error'), self.lang.get('msg_image_load_failed').format(error=str(e)))
+            self._msg('error', 'error', 'msg_image_load_failed', error=str(e))
             self.log_action(f"Image selection failed: {str(e)}")
 
     # ============== Screen Picker ==============
@@ -1007,7 +1315,7 @@ class PaletteApp(ctk.CTk):
 
             self.after(120, self._capture_and_show_picker)
         except Exception as e:
-            messagebox.showerror(self.lang.get('error'), self.lang.get('msg_screen_picker_failed').format(error=str(e)))
+            self._msg('error', 'error', 'msg_screen_picker_failed', error=str(e))
 
     def _capture_and_show_picker(self):
         """Capture screen and show color picker overlay"""
@@ -1018,11 +1326,11 @@ class PaletteApp(ctk.CTk):
                 screen = ImageGrab.grab()
             except Exception as e:
                 self._restore_window()
-                messagebox.showerror(self.lang.get('error'), self.lang.get('msg_capture_failed').format(error=str(e)))
+                self._msg('error', 'error', 'msg_capture_failed', error=str(e))
                 return
         except Exception as e:
             self._restore_window()
-            messagebox.showerror(self.lang.get('error'), self.lang.get('msg_capture_failed').format(error=str(e)))
+            self._msg('error', 'error', 'msg_capture_failed', error=str(e))
             return
 
         self._screen_image = screen
@@ -1034,18 +1342,9 @@ class PaletteApp(ctk.CTk):
         height = img_h
         
         try:
-            if os.name == 'nt':
-                import ctypes
-                user32 = ctypes.windll.user32
-                SM_XVIRTUALSCREEN = 76
-                SM_YVIRTUALSCREEN = 77
-                SM_CXVIRTUALSCREEN = 78
-                SM_CYVIRTUALSCREEN = 79
-                xv = user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
-                yv = user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
-                cvw = user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
-                cvh = user32.GetSystemMetrics(SM_CYVIRTUALSCREEN)
-                x0, y0, width, height = int(xv), int(yv), int(cvw), int(cvh)
+            virtual_screen = _get_virtual_screen()
+            if virtual_screen:
+                x0, y0, width, height = virtual_screen
         except Exception:
             x0, y0 = 0, 0
             width, height = img_w, img_h
@@ -1072,8 +1371,9 @@ class PaletteApp(ctk.CTk):
         else:
             self._setup_pixel_picker(picker, photo, x0, y0, width, height)
 
+        # Screen -> screenshot scale is fixed for this capture; compute it once
         self._screen_origin = (x0, y0)
-        self._virtual_size = (width, height)
+        self._picker_scale = (img_w / max(1, int(width)), img_h / max(1, int(height)))
         picker.focus_force()
     
     def _setup_pixel_picker(self, picker, photo, x0, y0, width, height):
@@ -1088,9 +1388,18 @@ class PaletteApp(ctk.CTk):
 
         self._picker_win = picker
         self._picker_floating = floating
+        self._picker_last_hex = None
+        # Window size for label placement; refreshed on <Configure>, not read per move
+        self._picker_size = (width, height)
 
         picker.bind('<Motion>', self._on_picker_move)
         picker.bind('<Button-1>', self._on_picker_click)
+        picker.bind('<Configure>', self._on_picker_configure)
+    
+    def _on_picker_configure(self, event):
+        """Track the pixel picker window size"""
+        if event.widget is self._picker_win and event.width > 1:
+            self._picker_size = (event.width, event.height)
     
     def _setup_region_picker(self, picker, photo, screen, x0, y0, width, height):
         """Setup region selection picker for image mode"""
@@ -1101,6 +1410,8 @@ class PaletteApp(ctk.CTk):
 
         canvas._rect_id = None
         canvas._start = None
+        canvas._drag_pos = None
+        canvas._drag_job = None
 
         def on_press(e):
             canvas._start = (e.x_root, e.y_root)
@@ -1109,14 +1420,23 @@ class PaletteApp(ctk.CTk):
                 canvas._rect_id = None
 
         def on_drag(e):
+            # Coalesce drag events: keep the latest pointer position and redraw the
+            # selection at most once per frame (each redraw repaints over the screenshot)
             if not canvas._start:
                 return
+            canvas._drag_pos = (e.x_root, e.y_root)
+            if canvas._drag_job is None:
+                canvas._drag_job = canvas.after(16, apply_drag)
+
+        def apply_drag():
+            canvas._drag_job = None
+            if not canvas._start or canvas._drag_pos is None:
+                return
             x0_root, y0_root = canvas._start
-            x1_root, y1_root = e.x_root, e.y_root
-            lx0 = int((x0_root - x0) * (width / max(1, width)))
-            ly0 = int((y0_root - y0) * (height / max(1, height)))
-            lx1 = int((x1_root - x0) * (width / max(1, width)))
-            ly1 = int((y1_root - y0) * (height / max(1, height)))
+            x1_root, y1_root = canvas._drag_pos
+            # Canvas coordinates are root coordinates relative to the picker's origin
+            lx0, ly0 = x0_root - x0, y0_root - y0
+            lx1, ly1 = x1_root - x0, y1_root - y0
             if canvas._rect_id:
                 canvas.coords(canvas._rect_id, lx0, ly0, lx1, ly1)
             else:
@@ -1124,6 +1444,9 @@ class PaletteApp(ctk.CTk):
                                                           outline=COLORS['accent'], width=2)
 
         def on_release(e):
+            if canvas._drag_job is not None:
+                canvas.after_cancel(canvas._drag_job)
+                canvas._drag_job = None
             if not canvas._start:
                 return
             x0_root, y0_root = canvas._start
@@ -1152,16 +1475,6 @@ class PaletteApp(ctk.CTk):
 
             region = screen.crop((sx, sy, ex, ey))
 
-            try:
-                temp_fd, temp_path = tempfile.mkstemp(suffix='.png')
-                os.close(temp_fd)
-                region.save(temp_path)
-            except Exception as err:
-                messagebox.showerror(self.lang.get('save_error_title'), 
-                                   self.lang.get('msg_save_screenshot_failed').format(error=str(err)))
-                canvas._start = None
-                return
-
             try:
                 picker.destroy()
             except Exception:
@@ -1176,19 +1489,53 @@ class PaletteApp(ctk.CTk):
                 self.img_thumbnail_label.configure(image=photo_thumb, text="")
                 self.img_thumbnail = photo_thumb
                 self.lbl_image.configure(text=self.lang.get('screenshot_label'))
+            except Exception:
+                pass
+
+            # Drop the previous image until this region is saved and analysed
+            self.image_path = None
+            self.extracted_colors = []
+            token = object()
+            self._pending_region = token
+
+            def finish_region(temp_path, colors):
+                if getattr(self, '_pending_region', None) is not token:
+                    # Superseded by a newer capture or image selection
+                    try:
+                        os.unlink(temp_path)
+                    except Exception:
+                        pass
+                    return
+                self._pending_region = None
+                if self._temp_screenshot and self._temp_screenshot != temp_path:
+                    try:
+                        os.unlink(self._temp_screenshot)
+                    except Exception:
+                        pass
                 self.image_path = temp_path
                 self._temp_screenshot = temp_path
-            except Exception:
+                self.extracted_colors = colors
+
+            def persist_region():
+                # PNG encode, disk write and K-means run off the UI thread
+                try:
+                    temp_fd, temp_path = tempfile.mkstemp(suffix='.png')
+                    os.close(temp_fd)
+                    region.save(temp_path)
+                except Exception as err:
+                    self.after(0, lambda msg=str(err): messagebox.showerror(
+                        self.lang.get('save_error_title'),
+                        self.lang.get('msg_save_screenshot_failed').format(error=msg)))
+                    return
+
                 try:
-                    os.unlink(temp_path)
+                    colors = self.generator.extract_main_colors(temp_path, num_colors=5)
                 except Exception:
-                    pass
+                    colors = []
+                self.after(0, lambda: finish_region(temp_path, colors))
 
-            try:
-                colors = self.generator.extract_main_colors(temp_path, num_colors=5)
-                self.extracted_colors = colors
-            except Exception:
-                self.extracted_colors = []
+            import threading
+            threading.Thread(target=persist_region, daemon=True).start()
 
         canvas.bind('<Button-1>', on_press)
         canvas.bind('<B1-Motion>', on_drag)
@@ -1199,14 +1546,9 @@ class PaletteApp(ctk.CTk):
         x = event.x_root
         y = event.y_root
         img = self._screen_image
-        x0, y0 = getattr(self, '_screen_origin', (0, 0))
-        
+        x0, y0 = self._screen_origin
+        scale_x, scale_y = self._picker_scale
         img_w, img_h = img.size
-        vw, vh = getattr(self, '_virtual_size', (img_w, img_h))
-        vw = max(1, int(vw))
-        vh = max(1, int(vh))
-        scale_x = img_w / vw
-        scale_y = img_h / vh
 
         local_x = int((x - x0) * scale_x)
         local_y = int((y - y0) * scale_y)
@@ -1222,25 +1564,26 @@ class PaletteApp(ctk.CTk):
         if isinstance(rgb, int):
             rgb = (rgb, rgb, rgb)
 
-        hx = self.generator.rgb_to_hex(rgb)
-        lum = (0.299*rgb[0] + 0.587*rgb[1] + 0.114*rgb[2])
-        txt_fill = '#000000' if lum > 160 else '#ffffff'
+        # Straight %-format on the channels; rgb_to_hex's type checks and
+        # str.format dispatch are measurable at motion-event rates
+        hx = '#%02x%02x%02x' % (rgb[0], rgb[1], rgb[2])
 
         f = self._picker_floating
-        f.config(text=hx, bg=hx, fg=txt_fill)
+        if hx != self._picker_last_hex:
+            # Integer Rec.601 luma: (77R + 150G + 29B) >> 8 ~= 0.299R + 0.587G + 0.114B
+            lum = (77 * rgb[0] + 150 * rgb[1] + 29 * rgb[2]) >> 8
+            f.config(text=hx, bg=hx, fg='#000000' if lum > 160 else '#ffffff')
+            self._picker_last_hex = hx
+            # Label size only changes with its text; measure here, not per move
+            self._picker_label_size = (f.winfo_reqwidth(), f.winfo_reqheight())
 
-        try:
-            vw = int(self._picker_win.winfo_width())
-            vh = int(self._picker_win.winfo_height())
-        except Exception:
-            vw, vh = img_w, img_h
+        vw, vh = self._picker_size
 
         midx = vw / 2
         midy = vh / 2
 
         pad = 8
-        fw = f.winfo_reqwidth()
-        fh = f.winfo_reqheight()
+        fw, fh = self._picker_label_size
 
         rel_x = x - x0
         rel_y = y - y0
@@ -1318,7 +1661,7 @@ class PaletteApp(ctk.CTk):
                     raise ValueError(self.lang.get('msg_invalid_hex_prompt'))
                 
                 palette = self.generator.generate_palette(hex_code, source_type='hex')
-                self.current_palettes = [palette]
+                self.current_palettes = [self._normalize_palette(palette)]
                 self.log_action(f"Generated palette from HEX: {hex_code}")
             else:
                 if not self.image_path:
@@ -1337,7 +1680,8 @@ class PaletteApp(ctk.CTk):
                     raise ValueError(self.lang.get('msg_extract_colors_failed'))
                 
                 self.extracted_colors = main_colors
-                palettes = [self.generator.generate_palette(c, source_type='rgb') for c in main_colors]
+                palettes = [self._normalize_palette(self.generator.generate_palette(c, source_type='rgb'))
+                            for c in main_colors]
                 self.current_palettes = palettes
                 self.log_action(f"Generated palette from image: {os.path.basename(self.image_path)}")
                 
@@ -1346,18 +1690,18 @@ class PaletteApp(ctk.CTk):
             self.log_action(f"Generate validation error: {str(e)}")
             return
         except Exception as e:
-            messagebox.showerror(self.lang.get('error'), self.lang.get('msg_palette_generation_failed').format(error=str(e)))
+            self._msg('error', 'error', 'msg_palette_generation_failed', error=str(e))
             self.log_action(f"Generate error: {str(e)}")
             return
 
         self.clear_palette_display()
         
         if source_type == 'ai':
-            self.display_ai_palettes(self.ai_palettes)
+            self._render_palette_display(self.display_ai_palettes, self.ai_palettes)
         elif source_type == 'hex':
-            self.display_single_palette(palette)
+            self._render_palette_display(self.display_single_palette, palette)
         else:
-            self.display_multiple_palettes(self.current_palettes)
+            self._render_palette_display(self.display_multiple_palettes, self.current_palettes)
     
     def _generate_ai_palette(self):
         """Generate AI color palette"""
@@ -1367,14 +1711,14 @@ class PaletteApp(ctk.CTk):
         api_key = settings.get('api_key', '')
         
         if not api_key:
-            messagebox.showwarning(self.lang.get('warning'), self.lang.get('msg_ai_api_key_required'))
+            self._msg('warning', 'warning', 'msg_ai_api_key_required')
             return
         
         if not self.ai_recommender:
             try:
                 self.ai_recommender = AIColorRecommender(api_key, lang=self.lang)
             except Exception as e:
-                messagebox.showerror(self.lang.get('error'), self.lang.get('msg_ai_init_failed').format(error=str(e)))
+                self._msg('error', 'error', 'msg_ai_init_failed', error=str(e))
                 return
         
         num_colors = settings.get('num_colors', 5)
@@ -1410,9 +1754,25 @@ class PaletteApp(ctk.CTk):
                 error_msg = str(e)
                 self.after(0, lambda: self._handle_ai_error(error_msg, loading_dialog))
         
-        import threading
-        thread = threading.Thread(target=generate_ai_palettes, daemon=True)
-        thread.start()
+        # One long-lived worker serves every request instead of a new thread per click.
+        # It is a daemon so an in-flight API call never keeps the process alive on exit
+        if self._ai_jobs is None:
+            import queue
+            import threading
+            self._ai_jobs = queue.Queue()
+            threading.Thread(target=self._run_ai_jobs, name='ai-gen', daemon=True).start()
+        self._ai_jobs.put(generate_ai_palettes)
+    
+    def _run_ai_jobs(self):
+        """AI worker loop: run queued jobs until a None sentinel arrives"""
+        while True:
+            job = self._ai_jobs.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception:
+                pass
     
     def _finish_ai_generation(self, new_palettes, loading_dialog):
         """Handle successful AI palette generation"""
@@ -1424,7 +1784,7 @@ class PaletteApp(ctk.CTk):
             self.log_action(f"Generated AI palettes: {len(new_palettes)} new palettes")
             
             self.clear_palette_display()
-            self.display_ai_palettes(self.ai_palettes)
+            self._render_palette_display(self.display_ai_palettes, self.ai_palettes)
         except Exception as e:
             messagebox.showerror(self.lang.get('error'), str(e))
     
@@ -1434,7 +1794,7 @@ class PaletteApp(ctk.CTk):
             loading_dialog.destroy()
         except:
             pass
-        messagebox.showerror(self.lang.get('ai_error_title'), self.lang.get('ai_generation_failed').format(error=error_msg))
+        self._msg('error', 'ai_error_title', 'ai_generation_failed', error=error_msg)
         self.log_action(f"AI generation error: {error_msg}")
 
     def validate_hex_color(self, hex_code):
@@ -1469,8 +1829,18 @@ class PaletteApp(ctk.CTk):
         
         self.generate()
 
+    def _render_palette_display(self, render, *args):
+        """Fill the palette area while it is unmapped, then show it in one layout pass"""
+        scroll = self.palette_scroll
+        scroll.pack_forget()
+        try:
+            render(*args)
+        finally:
+            scroll.pack(fill="both", expand=True, padx=10, pady=10)
+
     def clear_palette_display(self):
         """Clear palette display"""
+        self._hide_shared_tooltip()
         try:
             for child in self.palette_inner.winfo_children():
                 try:
@@ -1492,16 +1862,12 @@ class PaletteApp(ctk.CTk):
         frm.pack(fill='x', pady=3, padx=5)
         frm.pack_propagate(False)
         
-        # Color swatch
-        swatch = ctk.CTkFrame(
-            frm,
-            width=60,
-            height=50,
-            corner_radius=6,
-            fg_color=hex_color
-        )
+        # Color swatch: a plain label showing a shared pre-rendered tile
+        swatch = tk.Label(frm, bd=0, highlightthickness=0, bg=COLORS['bg_secondary'])
+        swatch.image = self._get_swatch(hex_color, 60, 50)
+        swatch.configure(image=swatch.image)
         swatch.pack(side='left', padx=8, pady=5)
-        swatch.pack_propagate(False)
+        frm.box_swatch = swatch
         
         # Info section
         info_frame = ctk.CTkFrame(frm, fg_color="transparent")
@@ -1511,7 +1877,7 @@ class PaletteApp(ctk.CTk):
         hex_label = ctk.CTkLabel(
             info_frame,
             text=hex_color.upper(),
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12, weight="bold"),
+            font=self._get_font(12, "bold"),
             text_color=COLORS['text_primary']
         )
         hex_label.pack(anchor='w')
@@ -1520,98 +1886,103 @@ class PaletteApp(ctk.CTk):
         rgb_label = ctk.CTkLabel(
             info_frame,
             text=label_text,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=10),
+            font=self._get_font(10),
             text_color=COLORS['text_secondary']
         )
         rgb_label.pack(anchor='w')
         
         if clickable:
-            # Tooltip window reference
-            tooltip_window = [None]
-            show_after_id = [None]
-            tooltip_text = self.lang.get('color_box_tooltip') if hasattr(self, 'lang') else "Left-click: Add to palette | Right-click: Set as base color"
-            
-            def destroy_tooltip():
-                if tooltip_window[0] is not None:
-                    try:
-                        if hasattr(self, 'active_tooltips') and tooltip_window[0] in self.active_tooltips:
-                            self.active_tooltips.remove(tooltip_window[0])
-                        tooltip_window[0].destroy()
-                    except Exception:
-                        pass
-                    tooltip_window[0] = None
-            
-            def show_tooltip(x_root, y_root):
-                destroy_tooltip()
-                tip = ctk.CTkToplevel(self)
-                tip.wm_overrideredirect(True)
-                try:
-                    tip.wm_attributes('-topmost', True)
-                except Exception:
-                    pass
-                tip.wm_geometry(f"+{x_root + 10}+{y_root + 10}")
-                tip.configure(fg_color=COLORS['bg_card'])
-                
-                label = ctk.CTkLabel(
-                    tip,
-                    text=tooltip_text,
-                    font=ctk.CTkFont(family=FONT_FAMILY, size=10),
-                    text_color=COLORS['text_primary']
-                )
-                label.pack(padx=8, pady=4)
-                tooltip_window[0] = tip
-                if hasattr(self, 'active_tooltips'):
-                    self.active_tooltips.append(tip)
-            
-            # Combined hover effect and tooltip
-            def on_enter(e=None):
-                frm.configure(fg_color=COLORS['bg_hover'])
-                if e:
-                    if show_after_id[0] is not None:
-                        try:
-                            frm.after_cancel(show_after_id[0])
-                        except Exception:
-                            pass
-                        show_after_id[0] = None
-                    
-                    show_after_id[0] = frm.after(120, lambda: show_tooltip(e.x_root, e.y_root))
-            
-            def on_leave(e=None):
-                frm.configure(fg_color=COLORS['bg_secondary'])
-                if show_after_id[0] is not None:
-                    try:
-                        frm.after_cancel(show_after_id[0])
-                    except Exception:
-                        pass
-                    show_after_id[0] = None
-                destroy_tooltip()
-            
-            def on_motion(e):
-                if tooltip_window[0] is not None:
-                    try:
-                        tooltip_window[0].wm_geometry(f"+{e.x_root + 10}+{e.y_root + 10}")
-                    except Exception:
-                        pass
-            
-            # Left click - add to saved palette
-            def on_left_click(e=None):
-                self.on_palette_color_click(hex_color)
-            
-            # Right click - set as base color
-            def on_right_click(e=None):
-                self.set_base_color(hex_color)
-            
-            for widget in [frm, swatch, info_frame, hex_label, rgb_label]:
-                widget.bind('<Button-1>', on_left_click)
-                widget.bind('<Button-3>', on_right_click)
-                widget.bind('<Enter>', on_enter)
-                widget.bind('<Leave>', on_leave)
-                widget.bind('<Motion>', on_motion)
+            # Event handlers are shared methods; they find the box via its attributes
+            frm.box_hex = hex_color
+            frm.tooltip_job = None
+            
+            # Events come from the shared 'ColorBox' class tag: one bindtags call per
+            # inner Tk widget instead of five binds on each of the box's widgets
+            for widget in (frm, swatch, info_frame, hex_label, rgb_label):
+                inners = [w for w in (getattr(widget, '_canvas', None), getattr(widget, '_label', None))
+                          if w is not None] or [widget]
+                for inner in inners:
+                    inner.bindtags(('ColorBox',) + inner.bindtags())
                 try:
                     widget.configure(cursor='hand2')
                 except Exception:
                     pass
     
+    def _get_swatch(self, hex_color, width, height, radius=6):
+        """Get a cached rounded color tile; boxes showing the same color share one image"""
+        key = (hex_color, width, height)
+        photo = self._swatch_cache.get(key)
+        if photo is not None:
+            self._swatch_cache.move_to_end(key)
+            return photo
+        try:
+            scale = ctk.ScalingTracker.get_widget_scaling(self)
+        except Exception:
+            scale = 1.0
+        w, h = round(width * scale), round(height * scale)
+        # Transparent corners show the box background, which changes on hover
+        img = Image.new('RGBA', (w, h), (0, 0, 0, 0))
+        ImageDraw.Draw(img).rounded_rectangle((0, 0, w - 1, h - 1), radius=round(radius * scale), fill=hex_color)
+        photo = ImageTk.PhotoImage(img)
+        self._swatch_cache[key] = photo
+        # Labels keep their own reference, so evicting only drops the cache's
+        if len(self._swatch_cache) > 512:
+            self._swatch_cache.popitem(last=False)
+        return photo
+    
+    def _color_box_from_event(self, e):
+        """Find the color box frame that owns the event's widget"""
+        w = e.widget
+        while w is not None and not hasattr(w, 'box_hex'):
+            w = getattr(w, 'master', None)
+        return w
+    
+    def _on_color_box_enter(self, e):
+        """Hover effect and delayed tooltip for a color box"""
+        box = self._color_box_from_event(e)
+        if box is None:
+            return
+        box.configure(fg_color=COLORS['bg_hover'])
+        box.box_swatch.configure(bg=COLORS['bg_hover'])
+        if box.tooltip_job is not None:
+            try:
+                box.after_cancel(box.tooltip_job)
+            except Exception:
+                pass
+        box.tooltip_job = box.after(120, self._show_shared_tooltip, e.x_root, e.y_root,
+                                    self._ui_text.color_box_tooltip)
+    
+    def _on_color_box_leave(self, e):
+        """Remove hover effect and hide the tooltip"""
+        box = self._color_box_from_event(e)
+        if box is None:
+            return
+        box.configure(fg_color=COLORS['bg_secondary'])
+        box.box_swatch.configure(bg=COLORS['bg_secondary'])
+        if box.tooltip_job is not None:
+            try:
+                box.after_cancel(box.tooltip_job)
+            except Exception:
+                pass
+            box.tooltip_job = None
+        self._hide_shared_tooltip()
+    
+    def _on_color_box_motion(self, e):
+        """Keep the tooltip next to the pointer"""
+        self._move_shared_tooltip(e.x_root, e.y_root)
+    
+    def _on_color_box_left_click(self, e):
+        """Left click - add to saved palette"""
+        box = self._color_box_from_event(e)
+        if box is not None:
+            self.on_palette_color_click(box.box_hex)
+    
+    def _on_color_box_right_click(self, e):
+        """Right click - set as base color"""
+        box = self._color_box_from_event(e)
+        if box is not None:
+            self.set_base_color(box.box_hex)
+    
     def set_base_color(self, hex_color):
         """Set the clicked color as the base color and regenerate palette"""
         try:
@@ -1632,145 +2003,137 @@ class PaletteApp(ctk.CTk):
     def display_single_palette(self, palette):
         """Display a single palette (for HEX mode)"""
         base = palette['base']
-        if isinstance(base, list):
-            base = tuple(base)
-        base_hex = self.generator.rgb_to_hex(base)
+        inner = self.palette_inner
+        draw = self.draw_color_box
+        rgb_to_hex = self.generator.rgb_to_hex
+        base_hex = rgb_to_hex(base)
         
         # Base color header
         header = ctk.CTkLabel(
-            self.palette_inner,
+            inner,
             text=self.lang.get('base_color_label'),
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13, weight="bold"),
+            font=self._get_font(13, "bold"),
             text_color=COLORS['text_primary']
         )
         header.pack(anchor='w', padx=5, pady=(10, 5))
         
-        self.draw_color_box(self.palette_inner, base_hex, f"RGB{base}")
+        draw(inner, base_hex, f"RGB{base}")
 
-        scheme_labels = {
-            'complementary': self.lang.get('complementary_label'),
-            'analogous': self.lang.get('analogous_label'),
-            'triadic': self.lang.get('triadic_label'),
-            'monochromatic': self.lang.get('monochromatic'),
-            'split_complementary': self.lang.get('split_complementary'),
-            'square': self.lang.get('square'),
-            'tetradic': self.lang.get('tetradic'),
-            'double_complementary': self.lang.get('double_complementary')
-        }
+        harmony_manager = None
 
-        for scheme in self.selected_schemes:
-            if scheme.startswith('custom_'):
-                self._display_custom_harmony(scheme, base_hex)
+        for scheme, label in self._scheme_render_plan(self._scheme_labels):
+            if label is None:
+                # Load saved harmonies once per render, not once per custom scheme
+                if harmony_manager is None:
+                    harmony_manager = self._load_harmony_manager()
+                self._display_custom_harmony(scheme, base_hex, harmony_manager)
             elif scheme in palette:
-                colors = palette[scheme]
-                label = scheme_labels.get(scheme, scheme)
-                
                 scheme_header = ctk.CTkLabel(
-                    self.palette_inner,
+                    inner,
                     text=label,
-                    font=ctk.CTkFont(family=FONT_FAMILY, size=12, weight="bold"),
+                    font=self._get_font(12, "bold"),
                     text_color=COLORS['text_primary']
                 )
                 scheme_header.pack(anchor='w', padx=5, pady=(15, 5))
                 
-                if isinstance(colors, (tuple, list)) and len(colors) == 3 and all(isinstance(c, int) for c in colors):
-                    if isinstance(colors, list):
-                        colors = tuple(colors)
-                    hx = self.generator.rgb_to_hex(colors)
-                    self.draw_color_box(self.palette_inner, hx, f"RGB{colors}")
-                else:
-                    for idx, col in enumerate(colors, 1):
-                        if isinstance(col, list):
-                            col = tuple(col)
-                        hx = self.generator.rgb_to_hex(col)
-                        self.draw_color_box(self.palette_inner, hx, f"{idx}. RGB{col}")
+                self._draw_scheme_colors(palette[scheme])
     
-    def _display_custom_harmony(self, scheme, base_hex):
+    def _scheme_render_plan(self, scheme_labels):
+        """Resolve each selected scheme to its label once per render (None marks a custom harmony)"""
+        return [
+            (scheme, None if scheme.startswith('custom_') else scheme_labels.get(scheme, scheme))
+            for scheme in self.selected_schemes
+        ]
+    
+    def _draw_scheme_colors(self, colors):
+        """Draw one scheme's colors: a single RGB triple or a tuple of them (see _normalize_palette)"""
+        inner = self.palette_inner
+        draw = self.draw_color_box
+        rgb_to_hex = self.generator.rgb_to_hex
+        if colors and isinstance(colors[0], int):
+            draw(inner, rgb_to_hex(colors), f"RGB{colors}")
+        else:
+            for idx, col in enumerate(colors, 1):
+                draw(inner, rgb_to_hex(col), f"{idx}. RGB{col}")
+    
+    def _load_harmony_manager(self):
+        """Create a CustomHarmonyManager (reads the saved harmonies from disk)"""
+        from custom_harmony import CustomHarmonyManager
+        return CustomHarmonyManager(self.file_handler)
+    
+    def _display_custom_harmony(self, scheme, base_hex, manager):
         """Display custom harmony colors"""
         try:
-            from custom_harmony import CustomHarmonyManager
-            manager = CustomHarmonyManager(self.file_handler)
             idx = int(scheme.split('_')[1])
             
             if idx < len(manager.harmonies):
                 harmony = manager.harmonies[idx]
                 colors = manager.apply_harmony(base_hex, idx)
-                label = harmony.get('name', self.lang.get('custom_harmony_default_name'))
+                label = harmony.get('name', self._ui_text.custom_harmony_default_name)
                 
                 scheme_header = ctk.CTkLabel(
                     self.palette_inner,
                     text=label,
-                    font=ctk.CTkFont(family=FONT_FAMILY, size=12, weight="bold"),
+                    font=self._get_font(12, "bold"),
                     text_color=COLORS['text_primary']
                 )
                 scheme_header.pack(anchor='w', padx=5, pady=(15, 5))
                 
+                inner = self.palette_inner
+                draw = self.draw_color_box
+                hex_to_rgb = self.generator.hex_to_rgb
                 for color_idx, color_hex in enumerate(colors, 1):
-                    rgb = self.generator.hex_to_rgb(color_hex)
-                    self.draw_color_box(self.palette_inner, color_hex, f"{color_idx}. RGB{rgb}")
+                    rgb = hex_to_rgb(color_hex)
+                    draw(inner, color_hex, f"{color_idx}. RGB{rgb}")
         except Exception:
             pass
 
     def display_multiple_palettes(self, palettes):
         """Display multiple palettes (for image mode)"""
-        scheme_labels = {
-            'complementary': self.lang.get('complementary'),
-            'analogous': self.lang.get('analogous'),
-            'triadic': self.lang.get('triadic'),
-            'monochromatic': self.lang.get('monochromatic'),
-            'split_complementary': self.lang.get('split_complementary'),
-            'square': self.lang.get('square'),
-            'tetradic': self.lang.get('tetradic'),
-            'double_complementary': self.lang.get('double_complementary')
-        }
+        # Scheme labels and custom/builtin split are the same for every palette
+        plan = self._scheme_render_plan(self._scheme_labels_indented)
+        harmony_manager = None
+        inner = self.palette_inner
+        draw = self.draw_color_box
+        rgb_to_hex = self.generator.rgb_to_hex
+        representative_text = self.lang.get('representative_color')
+        base_text = self.lang.get('base_color')
+        palette_icon = self._get_icon('palette')
         
         for i, p in enumerate(palettes, start=1):
             palette_header = ctk.CTkLabel(
-                self.palette_inner,
-                text=f" {self.lang.get('representative_color')} {i}",
-                image=self._get_icon('palette'),
+                inner,
+                text=f" {representative_text} {i}",
+                image=palette_icon,
                 compound='left',
-                font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"),
+                font=self._get_font(14, "bold"),
                 text_color=COLORS['accent_light']
             )
             palette_header.pack(anchor='w', padx=5, pady=(15, 5))
             
             base = p['base']
-            if isinstance(base, list):
-                base = tuple(base)
-            base_hex = self.generator.rgb_to_hex(base)
-            self.draw_color_box(self.palette_inner, base_hex, f"{self.lang.get('base_color')} RGB{base}")
-
-            for scheme in self.selected_schemes:
-                if scheme.startswith('custom_'):
-                    self._display_custom_harmony(scheme, base_hex)
+            base_hex = rgb_to_hex(base)
+            draw(inner, base_hex, f"{base_text} RGB{base}")
+
+            for scheme, label_text in plan:
+                if label_text is None:
+                    if harmony_manager is None:
+                        harmony_manager = self._load_harmony_manager()
+                    self._display_custom_harmony(scheme, base_hex, harmony_manager)
                 elif scheme in p:
-                    colors = p[scheme]
-                    label = scheme_labels.get(scheme, scheme)
-                    
                     scheme_label = ctk.CTkLabel(
-                        self.palette_inner,
-                        text=f"  {label}",
-                        font=ctk.CTkFont(family=FONT_FAMILY, size=11, weight="bold"),
+                        inner,
+                        text=label_text,
+                        font=self._get_font(11, "bold"),
                         text_color=COLORS['text_secondary']
                     )
                     scheme_label.pack(anchor='w', padx=5)
                     
-                    if isinstance(colors, (tuple, list)) and len(colors) == 3 and all(isinstance(c, int) for c in colors):
-                        if isinstance(colors, list):
-                            colors = tuple(colors)
-                        hx = self.generator.rgb_to_hex(colors)
-                        self.draw_color_box(self.palette_inner, hx, f"RGB{colors}")
-                    else:
-                        for idx, col in enumerate(colors, 1):
-                            if isinstance(col, list):
-                                col = tuple(col)
-                            hx = self.generator.rgb_to_hex(col)
-                            self.draw_color_box(self.palette_inner, hx, f"{idx}. RGB{col}")
+                    self._draw_scheme_colors(p[scheme])
             
             # Separator between palettes
             if i < len(palettes):
-                sep = ctk.CTkFrame(self.palette_inner, height=2, fg_color=COLORS['border'])
+                sep = ctk.CTkFrame(inner, height=2, fg_color=COLORS['border'])
                 sep.pack(fill='x', pady=15, padx=10)
 
     def display_ai_palettes(self, palettes):
@@ -1779,36 +2142,42 @@ class PaletteApp(ctk.CTk):
             empty_label = ctk.CTkLabel(
                 self.palette_inner,
                 text=self.lang.get('ai_no_palettes'),
-                font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+                font=self._get_font(12),
                 text_color=COLORS['text_muted']
             )
             empty_label.pack(pady=20)
             return
         
+        inner = self.palette_inner
+        draw = self.draw_color_box
+        hex_to_rgb = self.generator.hex_to_rgb
+        name_format = self.lang.get('ai_palette_name').format
+        sparkle_icon = self._get_icon('sparkle')
+        
         for i, palette_data in enumerate(palettes, start=1):
             if isinstance(palette_data, dict):
-                palette_name = palette_data.get('name', self.lang.get('ai_palette_name').format(i=i))
+                palette_name = palette_data.get('name', name_format(i=i))
                 palette_colors = palette_data.get('colors', [])
             else:
-                palette_name = self.lang.get('ai_palette_name').format(i=i)
+                palette_name = name_format(i=i)
                 palette_colors = palette_data
             
             header = ctk.CTkLabel(
-                self.palette_inner,
+                inner,
                 text=f" {palette_name}",
-                image=self._get_icon('sparkle'),
+                image=sparkle_icon,
                 compound='left',
-                font=ctk.CTkFont(family=FONT_FAMILY, size=13, weight="bold"),
+                font=self._get_font(13, "bold"),
                 text_color=COLORS['accent_light']
             )
             header.pack(anchor='w', padx=5, pady=(15 if i > 1 else 5, 5))
             
             for j, color_hex in enumerate(palette_colors, start=1):
-                rgb = self.generator.hex_to_rgb(color_hex)
-                self.draw_color_box(self.palette_inner, color_hex, f"{j}. RGB{rgb}")
+                rgb = hex_to_rgb(color_hex)
+                draw(inner, color_hex, f"{j}. RGB{rgb}")
             
             if i < len(palettes):
-                sep = ctk.CTkFrame(self.palette_inner, height=2, fg_color=COLORS['border'])
+                sep = ctk.CTkFrame(inner, height=2, fg_color=COLORS['border'])
                 sep.pack(fill='x', pady=15, padx=10)
 
     # ============== Saved Palettes Management ==============
@@ -1848,12 +2217,12 @@ class PaletteApp(ctk.CTk):
     def on_palette_color_click(self, hex_color):
         """Handle clicks on palette swatches"""
         if self._saved_selected is None:
-            messagebox.showinfo(self.lang.get('selection_required'), self.lang.get('select_palette_first'))
+            self._msg('info', 'selection_required', 'select_palette_first')
             return
         
         try:
             entry = self.saved_palettes[self._saved_selected]
-            hex_str = hex_color if isinstance(hex_color, str) else self.generator.rgb_to_hex(hex_color)
+            hex_str = _canon_hex(hex_color) if isinstance(hex_color, str) else self.generator.rgb_to_hex(hex_color)
             
             entry['colors'].append(hex_str)
             self.add_to_recent_colors(hex_str)
@@ -1865,32 +2234,49 @@ class PaletteApp(ctk.CTk):
             self.log_action(f"Error adding color to palette: {str(e)}")
 
     def render_saved_list(self):
-        """Render saved palettes list with modern design"""
-        for c in self.saved_list_container.winfo_children():
+        """Render saved palettes list (coalesced to one pass per idle cycle)"""
+        if not self._saved_render_pending:
+            self._saved_render_pending = True
+            self.after_idle(self._render_saved_list_now)
+    
+    def _render_saved_list_now(self):
+        """Sync the saved palette rows with saved_palettes, reusing existing rows"""
+        self._saved_render_pending = False
+        widgets = self._palette_widgets
+        palette_numbered = self._ui_text.palette_numbered
+        
+        # Rows are reused by index, so an open inline rename may no longer match its palette
+        for row in list(widgets.values()):
+            if row.get('rename_finish') is not None:
+                row['rename_finish'](False)
+        
+        for idx, entry in enumerate(self.saved_palettes):
+            row = widgets.get(idx)
+            if row is None:
+                self._create_palette_entry_widget(idx, entry)
+                continue
+            
+            name = entry['name'] if 'name' in entry else palette_numbered(i=idx+1)
+            if row['name_label'].cget('text') != name:
+                row['name_label'].configure(text=name)
+            self._apply_palette_entry_style(row, self._saved_selected == idx)
+            self._update_single_palette_entry(idx)
+        
+        # Drop rows for palettes that no longer exist
+        for idx in [i for i in widgets if i >= len(self.saved_palettes)]:
             try:
-                c.destroy()
+                widgets.pop(idx)['frame'].destroy()
             except Exception:
                 pass
-        
-        # Store widget references for incremental updates
-        self._palette_widgets = {}
-
-        for idx, entry in enumerate(self.saved_palettes):
-            self._create_palette_entry_widget(idx, entry)
 
         self.update_menu_states()
 
     def _create_palette_entry_widget(self, idx, entry):
         """Create a single palette entry widget and store references"""
-        is_selected = self._saved_selected == idx
-        
         # Palette card
         palette_frame = ctk.CTkFrame(
             self.saved_list_container,
-            corner_radius=8,
-            fg_color=COLORS['accent'] if is_selected else COLORS['bg_secondary'],
-            border_width=2 if is_selected else 1,
-            border_color=COLORS['accent_light'] if is_selected else COLORS['border']
+            corner_radius=8
         )
         palette_frame.pack(fill='x', pady=4, padx=2)
         
@@ -1900,8 +2286,8 @@ class PaletteApp(ctk.CTk):
         
         name_label = ctk.CTkLabel(
             header,
-            text=entry.get('name', self.lang.get('palette_numbered').format(i=idx+1)),
-            font=ctk.CTkFont(family=FONT_FAMILY, size=11, weight="bold"),
+            text=entry['name'] if 'name' in entry else self._ui_text.palette_numbered(i=idx+1),
+            font=self._get_font(11, "bold"),
             text_color=COLORS['text_primary']
         )
         name_label.pack(side='left')
@@ -1910,86 +2296,34 @@ class PaletteApp(ctk.CTk):
         color_count = len(entry.get('colors', []))
         count_label = ctk.CTkLabel(
             header,
-            text=self.lang.get('colors_count').format(count=color_count),
-            font=ctk.CTkFont(family=FONT_FAMILY, size=9),
+            text=self._ui_text.colors_count(count=color_count),
+            font=self._get_font(9),
             text_color=COLORS['text_muted']
         )
         count_label.pack(side='right')
         
-        # Color bar with Canvas for variable width ratio
-        colors = entry.get('colors', [])
-        canvas = None
-        bar_container = None
-        if colors:
-            bar_container = ctk.CTkFrame(palette_frame, height=30, fg_color="transparent")
-            bar_container.pack(fill='x', padx=10, pady=(0, 8))
-            bar_container.pack_propagate(False)
-            
-            display_colors = colors  # Show ALL colors
-            
-            # Use Canvas for precise width calculation
-            canvas = tk.Canvas(
-                bar_container,
-                height=30,
-                bg=COLORS['bg_secondary'],
-                highlightthickness=0
-            )
-            canvas.pack(fill='both', expand=True)
-            
-            # Store display_colors for redraw
-            canvas._display_colors = display_colors
-            
-            # Wait for canvas to render and get actual width
-            def draw_palette_bar(c=canvas):
-                try:
-                    c.delete('all')
-                    c.update_idletasks()
-                    canvas_width = c.winfo_width()
-                    if canvas_width <= 1:
-                        canvas_width = 400
-                    
-                    dc = c._display_colors
-                    box_width = float(canvas_width) / float(len(dc))
-                    for i, color in enumerate(dc):
-                        x1 = int(i * box_width)
-                        x2 = int((i + 1) * box_width)
-                        c.create_rectangle(x1, 0, x2, 30, fill=color, outline='')
-                except Exception:
-                    pass
-            
-            canvas.after(50, draw_palette_bar)
-        else:
-            # Empty palette indicator
-            empty_label = ctk.CTkLabel(
-                palette_frame,
-                text=self.lang.get('empty_palette_msg'),
-                font=ctk.CTkFont(family=FONT_FAMILY, size=9),
-                text_color=COLORS['text_muted']
-            )
-            empty_label.pack(pady=(0, 8))
-        
         # Store widget references
-        self._palette_widgets[idx] = {
+        row = {
             'frame': palette_frame,
             'header': header,
             'name_label': name_label,
             'count_label': count_label,
-            'canvas': canvas,
-            'bar_container': bar_container,
+            'canvas': None,
+            'bar_container': None,
+            'empty_label': None,
+            'colors_key': None,
+            'rename_entry': None,
+            'rename_finish': None,
         }
+        self._palette_widgets[idx] = row
+        self._apply_palette_entry_style(row, self._saved_selected == idx)
         
-        # Click binding - optimize selection (no full re-render)
-        def make_select(i):
-            def select_handler(e=None):
-                if self._saved_selected != i:
-                    prev = self._saved_selected
-                    self._saved_selected = i
-                    self._update_selection_style(prev, i)
-                    self.update_menu_states()
-            return select_handler
+        # Color bar (or empty palette indicator)
+        self._update_single_palette_entry(idx)
         
+        # Click binding - optimize selection (no full re-render)
         for widget in [palette_frame, header, name_label]:
-            widget.bind('<Button-1>', make_select(idx))
+            widget.bind('<Button-1>', lambda e, i=idx: self._select_saved_entry(i))
             try:
                 widget.configure(cursor='hand2')
             except Exception:
@@ -2002,159 +2336,230 @@ class PaletteApp(ctk.CTk):
         for widget in [palette_frame, header, name_label]:
             widget.bind('<Button-3>', make_context_menu(idx))
         
-        # Double-click to edit
+        # Double-click to edit (on the name itself: rename in place)
         def make_edit(i):
             return lambda e: self.open_palette_editor(i)
         
-        for widget in [palette_frame, header, name_label]:
+        for widget in [palette_frame, header]:
             widget.bind('<Double-Button-1>', make_edit(idx))
+        name_label.bind('<Double-Button-1>', lambda e, i=idx: self.rename_palette(i))
 
-    def _update_selection_style(self, old_idx, new_idx):
-        """Update visual selection state without re-rendering"""
-        if not hasattr(self, '_palette_widgets'):
+    def _set_palette_entry_colors(self, idx, row, colors):
+        """Show colors in a palette row, switching between bar and empty label as needed"""
+        colors_key = tuple(colors)
+        if colors_key == row['colors_key']:
             return
-        # Deselect old
-        if old_idx is not None and old_idx in self._palette_widgets:
-            w = self._palette_widgets[old_idx]
-            try:
-                w['frame'].configure(
-                    fg_color=COLORS['bg_secondary'],
-                    border_width=1,
-                    border_color=COLORS['border']
-                )
-            except Exception:
-                pass
-        # Select new
-        if new_idx is not None and new_idx in self._palette_widgets:
-            w = self._palette_widgets[new_idx]
-            try:
-                w['frame'].configure(
-                    fg_color=COLORS['accent'],
-                    border_width=2,
-                    border_color=COLORS['accent_light']
+        row['colors_key'] = colors_key
+        palette_frame = row['frame']
+        canvas = row['canvas']
+        
+        if colors and canvas is not None:
+            # Just redraw the canvas with updated colors (coalesced with other bar updates)
+            canvas._display_colors = colors
+            self._schedule_palette_bar(canvas)
+        elif colors:
+            if row['empty_label'] is not None:
+                row['empty_label'].destroy()
+                row['empty_label'] = None
+            
+            bar_container = ctk.CTkFrame(palette_frame, height=30, fg_color="transparent")
+            bar_container.pack(fill='x', padx=10, pady=(0, 8))
+            bar_container.pack_propagate(False)
+            
+            # Use Canvas for precise width calculation
+            canvas = tk.Canvas(
+                bar_container,
+                height=30,
+                bg=COLORS['bg_secondary'],
+                highlightthickness=0
+            )
+            canvas.pack(fill='both', expand=True)
+            canvas.bind('<Configure>', self._on_palette_bar_configure)
+            
+            # Store display_colors for redraw
+            canvas._display_colors = colors
+            row['canvas'] = canvas
+            row['bar_container'] = bar_container
+            
+            for w in [bar_container, canvas]:
+                w.bind('<Button-1>', lambda e, i=idx: self._select_saved_entry(i))
+                w.bind('<Button-3>', lambda e, i=idx: self.show_palette_context_menu(i, e))
+                w.bind('<Double-Button-1>', lambda e, i=idx: self.open_palette_editor(i))
+            
+            # Wait for canvas to render and get actual width
+            self._schedule_palette_bar(canvas)
+        else:
+            if row['bar_container'] is not None:
+                row['bar_container'].destroy()
+                row['bar_container'] = None
+                row['canvas'] = None
+            
+            if row['empty_label'] is None:
+                # Empty palette indicator
+                row['empty_label'] = ctk.CTkLabel(
+                    palette_frame,
+                    text=self._ui_text.empty_palette_msg,
+                    font=self._get_font(9),
+                    text_color=COLORS['text_muted']
                 )
-            except Exception:
-                pass
+                row['empty_label'].pack(pady=(0, 8))
 
-    def _update_single_palette_entry(self, idx):
-        """Update a single palette entry's color bar and count without re-rendering everything"""
-        if not hasattr(self, '_palette_widgets') or idx not in self._palette_widgets:
-            self.render_saved_list()
-            return
-        
-        entry = self.saved_palettes[idx]
-        colors = entry.get('colors', [])
-        widgets = self._palette_widgets[idx]
-        
-        # Update count label
+    def _schedule_palette_bar(self, canvas):
+        """Queue a palette color bar for the next coalesced redraw pass"""
+        self._pending_palette_bars[canvas] = None
+        if self._palette_bar_job is None:
+            self._palette_bar_job = self.after(50, self._flush_palette_bars)
+    
+    def _flush_palette_bars(self):
+        """Redraw all queued color bars after a single layout pass"""
+        self._palette_bar_job = None
+        canvases = list(self._pending_palette_bars)
+        self._pending_palette_bars.clear()
         try:
-            widgets['count_label'].configure(
-                text=self.lang.get('colors_count').format(count=len(colors))
-            )
+            self.update_idletasks()
         except Exception:
             pass
-        
-        # Update color bar
-        canvas = widgets.get('canvas')
-        bar_container = widgets.get('bar_container')
-        palette_frame = widgets.get('frame')
-        
-        if colors and canvas is not None:
-            # Just redraw the canvas with updated colors
-            canvas._display_colors = colors
+        for canvas in canvases:
+            self._draw_palette_bar(canvas)
+    
+    def _on_palette_bar_configure(self, e):
+        """Re-tile a saved palette bar when its canvas is resized"""
+        c = e.widget
+        if e.width > 1 and e.width != getattr(c, '_drawn_width', None):
+            self._draw_palette_bar(c, e.width)
+    
+    def _draw_palette_bar(self, c, canvas_width=None):
+        """Draw a saved palette's colors across its bar canvas"""
+        try:
+            if not c.winfo_exists():
+                return
+            c.delete('all')
+            if canvas_width is None:
+                canvas_width = c.winfo_width()
+            if canvas_width <= 1:
+                canvas_width = 400
+            c._drawn_width = canvas_width
+            
+            dc = c._display_colors
+            bar_height = getattr(c, '_bar_height', 30)
             try:
-                canvas.delete('all')
-                canvas.update_idletasks()
-                canvas_width = canvas.winfo_width()
-                if canvas_width <= 1:
-                    canvas_width = 400
-                box_width = float(canvas_width) / float(len(colors))
-                for i, color in enumerate(colors):
-                    x1 = int(i * box_width)
-                    x2 = int((i + 1) * box_width)
-                    canvas.create_rectangle(x1, 0, x2, 30, fill=color, outline='')
+                # One image item for the whole bar instead of a rectangle per color
+                c._bar_img = self._palette_bar_image(dc, canvas_width, bar_height)
+                c.create_image(0, 0, image=c._bar_img, anchor='nw')
+                return
             except Exception:
-                pass
-        elif colors and canvas is None:
-            # Had no colors before, now has colors - create canvas in-place
-            try:
-                # Remove the empty palette label if it exists
-                for child in palette_frame.winfo_children():
-                    if isinstance(child, ctk.CTkLabel) and child not in [widgets.get('name_label'), widgets.get('count_label')]:
-                        # Check if this is the empty palette message label (not in header)
-                        if child.master == palette_frame:
-                            child.destroy()
-
-                bar_container = ctk.CTkFrame(palette_frame, height=30, fg_color="transparent")
-                bar_container.pack(fill='x', padx=10, pady=(0, 8))
-                bar_container.pack_propagate(False)
-
-                canvas = tk.Canvas(
-                    bar_container,
-                    height=30,
-                    bg=COLORS['bg_secondary'],
-                    highlightthickness=0
-                )
-                canvas.pack(fill='both', expand=True)
-                canvas._display_colors = colors
-
-                # Update widget references
-                widgets['canvas'] = canvas
-                widgets['bar_container'] = bar_container
+                c._bar_img = None
+            box_width = float(canvas_width) / float(len(dc))
+            for i, color in enumerate(dc):
+                x1 = int(i * box_width)
+                x2 = int((i + 1) * box_width)
+                c.create_rectangle(x1, 0, x2, bar_height, fill=color, outline='')
+        except Exception:
+            pass
 
-                def draw_palette_bar(c=canvas):
-                    try:
-                        c.delete('all')
-                        c.update_idletasks()
-                        canvas_width = c.winfo_width()
-                        if canvas_width <= 1:
-                            canvas_width = 400
-                        dc = c._display_colors
-                        box_width = float(canvas_width) / float(len(dc))
-                        for i, color in enumerate(dc):
-                            x1 = int(i * box_width)
-                            x2 = int((i + 1) * box_width)
-                            c.create_rectangle(x1, 0, x2, 30, fill=color, outline='')
-                    except Exception:
-                        pass
+    def _palette_bar_image(self, colors, width, height):
+        """Render colors as equal-width vertical stripes into a PhotoImage"""
+        rgb = _hex_array(colors).tobytes()
+        n = len(colors)
+        box_width = float(width) / float(n)
+        # Same stripe boundaries as the rectangle drawing, with the last one pinned to width
+        edges = [int(i * box_width) for i in range(n)] + [width]
+        row = b''.join(rgb[3 * i:3 * i + 3] * (edges[i + 1] - edges[i]) for i in range(n))
+        img = Image.frombytes('RGB', (width, height), row * height)
+        return ImageTk.PhotoImage(img)
+
+    def _apply_palette_entry_style(self, row, selected):
+        """Apply selected/unselected card style to a palette row"""
+        try:
+            if selected:
+                row['frame'].configure(
+                    fg_color=COLORS['accent'],
+                    border_width=2,
+                    border_color=COLORS['accent_light']
+                )
+            else:
+                row['frame'].configure(
+                    fg_color=COLORS['bg_secondary'],
+                    border_width=1,
+                    border_color=COLORS['border']
+                )
+        except Exception:
+            pass
 
-                canvas.after(50, draw_palette_bar)
+    def _update_selection_style(self, old_idx, new_idx):
+        """Update visual selection state without re-rendering"""
+        # Deselect old
+        if old_idx is not None and old_idx in self._palette_widgets:
+            self._apply_palette_entry_style(self._palette_widgets[old_idx], False)
+        # Select new
+        if new_idx is not None and new_idx in self._palette_widgets:
+            self._apply_palette_entry_style(self._palette_widgets[new_idx], True)
 
-                # Bind click events to new widgets
-                for w in [bar_container, canvas]:
-                    w.bind('<Button-1>', lambda e, i=idx: self._select_saved_entry(i))
-                    w.bind('<Button-3>', lambda e, i=idx: self.show_palette_context_menu(i, e))
-                    w.bind('<Double-Button-1>', lambda e, i=idx: self.on_palette_color_click(i, e))
-            except Exception:
-                pass
+    def _update_single_palette_entry(self, idx):
+        """Update a single palette entry's color bar and count without re-rendering everything"""
+        if idx not in self._palette_widgets:
+            self.render_saved_list()
+            return
+        
+        entry = self.saved_palettes[idx]
+        colors = entry.get('colors', [])
+        widgets = self._palette_widgets[idx]
+        
+        # Update count label
+        try:
+            count_text = self._ui_text.colors_count(count=len(colors))
+            if widgets['count_label'].cget('text') != count_text:
+                widgets['count_label'].configure(text=count_text)
+        except Exception:
+            pass
+        
+        # Update color bar ('value' view shows each color's luma)
+        try:
+            if colors and entry.get('view_mode') == 'value':
+                # Keep the gray view on the row so toggling back and forth reuses it
+                key = tuple(colors)
+                if widgets.get('gray_key') != key:
+                    widgets['gray_key'] = key
+                    widgets['gray_colors'] = [_gray_hex(c) for c in key]
+                colors = widgets['gray_colors']
+            self._set_palette_entry_colors(idx, widgets, colors)
+        except Exception:
+            pass
 
     def _select_saved_entry(self, idx):
-        """Select a saved palette entry"""
+        """Select a saved palette entry (restyles only the old and new rows)"""
         prev = self._saved_selected
+        if prev == idx:
+            return
         self._saved_selected = idx
         self._update_selection_style(prev, idx)
         self.update_menu_states()
 
     def show_palette_context_menu(self, idx, event):
         """Show context menu for palette operations"""
-        prev = self._saved_selected
-        self._saved_selected = idx
-        self._update_selection_style(prev, idx)
-        self.update_menu_states()
+        self._select_saved_entry(idx)
         
         entry = self.saved_palettes[idx]
         current_mode = entry.get('view_mode', 'rgb')
-        view_label = self.lang.get('view_rgb') if current_mode == 'value' else self.lang.get('view_value')
-        
-        menu = tk.Menu(self, tearoff=0, bg=COLORS['bg_card'], fg=COLORS['text_primary'])
-        menu.add_command(label=self.lang.get('context_rename'), command=lambda: self.rename_palette(idx))
-        menu.add_command(label=self.lang.get('context_edit_palette'), command=lambda: self.open_palette_editor(idx))
-        menu.add_command(label=self.lang.get('context_save_palette'), command=lambda: self.save_palette_file(idx))
-        menu.add_separator()
-        menu.add_command(label=self.lang.get('context_export_txt'), command=lambda: self.export_palette_txt(idx))
-        menu.add_command(label=self.lang.get('context_export_png'), command=lambda: self.export_palette_png(idx))
-        menu.add_separator()
-        menu.add_command(label=view_label, command=lambda: self.toggle_palette_view(idx))
+        text = self._ui_text
+        view_label = text.view_rgb if current_mode == 'value' else text.view_value
+        
+        # Menu is built once; its commands act on whichever palette it was posted for
+        menu = self._palette_ctx_menu
+        if menu is None:
+            menu = tk.Menu(self, tearoff=0, bg=COLORS['bg_card'], fg=COLORS['text_primary'])
+            menu.add_command(label=text.context_rename, command=lambda: self.rename_palette(self._palette_ctx_idx))
+            menu.add_command(label=text.context_edit_palette, command=lambda: self.open_palette_editor(self._palette_ctx_idx))
+            menu.add_command(label=text.context_save_palette, command=lambda: self.save_palette_file(self._palette_ctx_idx))
+            menu.add_separator()
+            menu.add_command(label=text.context_export_txt, command=lambda: self.export_palette_txt(self._palette_ctx_idx))
+            menu.add_command(label=text.context_export_png, command=lambda: self.export_palette_png(self._palette_ctx_idx))
+            menu.add_separator()
+            menu.add_command(label=view_label, command=lambda: self.toggle_palette_view(self._palette_ctx_idx))
+            self._palette_ctx_menu = menu
+        else:
+            menu.entryconfigure('end', label=view_label)
+        self._palette_ctx_idx = idx
         
         try:
             menu.post(event.x_root, event.y_root)
@@ -2164,7 +2569,7 @@ class PaletteApp(ctk.CTk):
     def copy_palette(self):
         """Copy currently selected palette"""
         if self._saved_selected is None:
-            messagebox.showinfo(self.lang.get('selection_required'), self.lang.get('select_palette_first'))
+            self._msg('info', 'selection_required', 'select_palette_first')
             return
         try:
             entry = self.saved_palettes[self._saved_selected]
@@ -2196,18 +2601,17 @@ class PaletteApp(ctk.CTk):
                 self._show_palette_selection_dialog(metadata)
                 
         except Exception as e:
-            messagebox.showerror(self.lang.get('load_error_title'), self.lang.get('msg_load_failed').format(error=str(e)))
+            self._msg('error', 'load_error_title', 'msg_load_failed', error=str(e))
             self.log_action(f"Load palette failed: {str(e)}")
     
     def _load_palette_from_file(self, filename):
         """Load palette from a specific file"""
         try:
-            import json
-            import base64
-            with open(filename, 'r', encoding='utf-8') as f:
+            # Raw bytes straight into b64decode; no text decode/encode round trip
+            with open(filename, 'rb') as f:
                 encoded = f.read()
-            data = json.loads(base64.b64decode(encoded.encode('utf-8')).decode('utf-8'))
-            new_entry = {'name': data['name'], 'colors': data['colors']}
+            data = _json_loads(base64.b64decode(encoded))
+            new_entry = {'name': data['name'], 'colors': _canon_colors(data['colors'])}
             self.saved_palettes.append(new_entry)
             self._saved_selected = len(self.saved_palettes) - 1
             self.render_saved_list()
@@ -2271,6 +2675,7 @@ class PaletteApp(ctk.CTk):
     def open_harmony_selector(self):
         """Open harmony scheme selector dialog"""
         dialog = ctk.CTkToplevel(self)
+        self._scope_scroll_bindings(dialog)
         set_window_icon(dialog)
         dialog.title(self.lang.get('harmonies_title'))
         dialog.geometry("450x550")
@@ -2331,8 +2736,9 @@ class PaletteApp(ctk.CTk):
                     text_color=COLORS['text_primary']
                 ).pack(anchor='w', pady=5, padx=10)
                 
+                numbered = self.lang.get('custom_harmony_numbered').format
                 for i, harmony in enumerate(manager.harmonies):
-                    harmony_name = harmony.get('name', self.lang.get('custom_harmony_numbered').format(i=i + 1))
+                    harmony_name = harmony['name'] if 'name' in harmony else numbered(i=i + 1)
                     scheme_key = f'custom_{i}'
                     var = ctk.BooleanVar(value=(scheme_key in self.selected_schemes))
                     scheme_vars[scheme_key] = var
@@ -2355,7 +2761,7 @@ class PaletteApp(ctk.CTk):
         def apply_selection():
             self.selected_schemes = [key for key, var in scheme_vars.items() if var.get()]
             if not self.selected_schemes:
-                messagebox.showwarning(self.lang.get('warning'), self.lang.get('msg_select_harmony_required'))
+                self._msg('warning', 'warning', 'msg_select_harmony_required')
                 return
             dialog.destroy()
             self.generate()
@@ -2367,6 +2773,7 @@ class PaletteApp(ctk.CTk):
     def open_settings(self):
         """Open settings dialog"""
         dialog = ctk.CTkToplevel(self)
+        self._scope_scroll_bindings(dialog)
         set_window_icon(dialog)
         dialog.title(self.lang.get('dialog_settings'))
         dialog.geometry("550x650")
@@ -2661,7 +3068,7 @@ class PaletteApp(ctk.CTk):
             self.config_manager.set('shortcuts', new_shortcuts)
             
             if self.config_manager.save_config():
-                messagebox.showinfo(self.lang.get('settings_saved_title'), self.lang.get('settings_saved'))
+                self._msg('info', 'settings_saved_title', 'settings_saved')
                 self.log_action("Settings saved")
                 
                 self.auto_save_enabled = auto_save_var.get()
@@ -2674,8 +3081,8 @@ class PaletteApp(ctk.CTk):
 
                 self.max_recent_colors = max(1, min(100, max_recent_colors_var.get()))
                 if len(self.recent_colors) > self.max_recent_colors:
-                    self.recent_colors = self.recent_colors[:self.max_recent_colors]
-                    self.config_manager.set('recent_colors', self.recent_colors)
+                    self._trim_recent_colors()
+                    self.config_manager.set('recent_colors', list(reversed(self.recent_colors)))
                     self.config_manager.save_config()
                 self.update_recent_colors_display()
                 
@@ -2684,7 +3091,7 @@ class PaletteApp(ctk.CTk):
                 
                 dialog.destroy()
             else:
-                messagebox.showerror(self.lang.get('settings_save_failed_title'), self.lang.get('settings_save_failed'))
+                self._msg('error', 'settings_save_failed_title', 'settings_save_failed')
 
         ModernButton(btn_frame, text=self.lang.get('button_save'), command=save_settings, width=100).pack(side='left', padx=5)
         ModernSecondaryButton(btn_frame, text=self.lang.get('button_cancel'), command=dialog.destroy, width=100).pack(side='left', padx=5)
@@ -2695,7 +3102,7 @@ class PaletteApp(ctk.CTk):
         response = messagebox.askyesno(self.lang.get('reset_settings_title'), self.lang.get('msg_reset_settings_confirm'))
         if response:
             self.config_manager.reset_to_defaults()
-            messagebox.showinfo(self.lang.get('reset_done_title'), self.lang.get('msg_settings_reset_done'))
+            self._msg('info', 'reset_done_title', 'msg_settings_reset_done')
             self.log_action("Settings reset to defaults")
 
     # ============== File Operations ==============
@@ -2748,7 +3155,7 @@ class PaletteApp(ctk.CTk):
                     self.log_action(f"Saved new workspace: {path}")
                 return result
             except Exception as e:
-                messagebox.showerror(self.lang.get('save_error_title'), self.lang.get('msg_save_failed').format(error=str(e)))
+                self._msg('error', 'save_error_title', 'msg_save_failed', error=str(e))
                 return False
 
     def save_pgf_as(self):
@@ -2771,75 +3178,151 @@ class PaletteApp(ctk.CTk):
                 self.log_action(f"Saved workspace as: {path}")
             return result
         except Exception as e:
-            messagebox.showerror(self.lang.get('save_error_title'), self.lang.get('msg_save_failed').format(error=str(e)))
+            self._msg('error', 'save_error_title', 'msg_save_failed', error=str(e))
             return False
 
     def _save_to_file(self, path):
         """Save workspace to file"""
         try:
-            import json
-            
             if not path:
                 raise ValueError(self.lang.get('msg_no_save_path'))
             
+            # Auto-save keeps hitting the same folder; only ensure it exists once
             directory = os.path.dirname(path)
-            if directory and not os.path.exists(directory):
+            if directory and directory != self._last_write_dir:
                 os.makedirs(directory, exist_ok=True)
+                self._last_write_dir = directory
             
             workspace_data = {
                 'saved_palettes': self.saved_palettes or [],
                 'selected_schemes': self.selected_schemes or [],
                 'source_type': self.source_type.get() if hasattr(self, 'source_type') else 'hex',
                 'hex_entry': self.hex_entry.get() if hasattr(self, 'hex_entry') else '#3498db',
-                'current_palettes': getattr(self, 'current_palettes', []),
+                'current_palettes': [self._serialize_palette(p) for p in getattr(self, 'current_palettes', [])],
                 'saved_counter': self._saved_counter,
                 'saved_selected': self._saved_selected,
-                'version': '1.0'
+                'version': '2.0'
             }
             
-            data_json = json.dumps(workspace_data, ensure_ascii=False)
-            encrypted = self._encrypt_aes(data_json)
+            payload = _json_dumps(workspace_data)
+            payload_hash = hashlib.sha256(payload).digest()
             
-            temp_path = path + '.tmp'
-            try:
-                with open(temp_path, 'wb') as f:
-                    f.write(encrypted)
-                
-                if os.path.exists(path):
-                    backup_path = path + '.bak'
-                    if os.path.exists(backup_path):
-                        os.remove(backup_path)
-                    os.rename(path, backup_path)
-                
-                os.rename(temp_path, path)
-                
-                backup_path = path + '.bak'
-                if os.path.exists(backup_path):
-                    try:
-                        os.remove(backup_path)
-                    except Exception:
-                        pass
-                        
-            except Exception as write_error:
-                if os.path.exists(temp_path):
-                    try:
-                        os.remove(temp_path)
-                    except Exception:
-                        pass
-                raise write_error
+            # Same content already on disk at this path: skip encrypt + write
+            if not (payload_hash == self._last_saved_hash and path == self.current_file
+                    and os.path.exists(path)):
+                encrypted = self._encrypt_aes(payload)
+                self._write_file_atomic(path, encrypted)
+                self._last_saved_hash = payload_hash
             
             self.current_file = path
             self.is_modified = False
             self.update_title()
             
             self.add_recent_file(path)
-            messagebox.showinfo(self.lang.get('saved_title'), self.lang.get('msg_workspace_saved').format(path=path))
+            self._msg('info', 'saved_title', 'msg_workspace_saved', path=path)
             return True
             
         except Exception as e:
-            messagebox.showerror(self.lang.get('save_error_title'), self.lang.get('msg_save_failed').format(error=str(e)))
+            self._msg('error', 'save_error_title', 'msg_save_failed', error=str(e))
             return False
 
+    def _serialize_palette(self, palette):
+        """Pack a generated palette's RGB sections into one flat int array"""
+        if not isinstance(palette, dict) or 'base' not in palette:
+            return palette  # AI/custom palettes keep their own shape
+        
+        def is_rgb(value):
+            return isinstance(value, (tuple, list)) and len(value) == 3 and all(isinstance(x, int) for x in value)
+        
+        keys, sizes, flat = [], [], []
+        for key, value in palette.items():
+            if is_rgb(value):
+                sizes.append(-1)  # single color
+                flat.extend(value)
+            elif isinstance(value, (tuple, list)) and all(is_rgb(c) for c in value):
+                sizes.append(len(value))
+                for color in value:
+                    flat.extend(color)
+            else:
+                return palette
+            keys.append(key)
+        
+        return {'packed': keys, 'sizes': sizes, 'rgb': flat}
+    
+    def _normalize_palette(self, palette):
+        """Store a generated palette's colors as int tuples (a color, or a tuple of colors) once"""
+        if not isinstance(palette, dict) or 'base' not in palette:
+            return palette  # AI/custom palettes keep their own shape
+        
+        normalized = {}
+        for key, value in palette.items():
+            if isinstance(value, (tuple, list)):
+                if len(value) == 3 and all(isinstance(x, int) for x in value):
+                    value = tuple(value)
+                else:
+                    value = tuple(tuple(c) if isinstance(c, list) else c for c in value)
+            normalized[key] = value
+        return normalized
+    
+    def _deserialize_palette(self, data):
+        """Unpack a palette stored by _serialize_palette (other shapes pass through)"""
+        if not isinstance(data, dict) or 'packed' not in data:
+            return data
+        
+        flat = data['rgb']
+        palette = {}
+        pos = 0
+        for key, size in zip(data['packed'], data['sizes']):
+            if size < 0:
+                palette[key] = tuple(flat[pos:pos + 3])
+                pos += 3
+            else:
+                end = pos + 3 * size
+                palette[key] = [tuple(flat[i:i + 3]) for i in range(pos, end, 3)]
+                pos = end
+        return palette
+    
+    def _write_file_atomic(self, path, data):
+        """Write bytes atomically: exclusive temp file, fsync, read-back verify, os.replace"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                # mkstemp creates the file 0600 and os.replace keeps that mode; give the
+                # result the target's existing mode, or the umask default for a new file
+                if hasattr(os, 'fchmod'):
+                    try:
+                        mode = os.stat(path).st_mode & 0o7777
+                    except OSError:
+                        mode = 0o666 & ~_UMASK
+                    os.fchmod(f.fileno(), mode)
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            with open(temp_path, 'rb') as f:
+                if hashlib.sha256(f.read()).digest() != hashlib.sha256(data).digest():
+                    raise IOError(f"Write verification failed: {temp_path}")
+            
+            os.replace(temp_path, path)
+        except Exception:
+            try:
+                os.remove(temp_path)
+            except Exception:
+                pass
+            raise
+        
+        # Persist the rename itself (directories cannot be opened on Windows)
+        if os.name != 'nt':
+            try:
+                dir_fd = os.open(directory, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError:
+                pass
+
     def load_pgf(self):
         """Load workspace"""
         try:
@@ -2850,34 +3333,56 @@ class PaletteApp(ctk.CTk):
             )
             if not path:
                 return
-            
+        except Exception as e:
+            self._msg('error', 'load_error_title', 'msg_load_failed', error=str(e))
+            return
+        
+        self._load_workspace_from_path(path)
+    
+    def _load_workspace_from_path(self, path):
+        """Load workspace from path, reporting failures to the user"""
+        try:
             self._load_pgf_from_path(path)
+            return True
         except Exception as e:
-            messagebox.showerror(self.lang.get('load_error_title'), self.lang.get('msg_load_failed').format(error=str(e)))
+            self._msg('error', 'load_error_title', 'msg_load_failed', error=str(e))
+            return False
     
-    def _load_pgf_from_path(self, path):
-        """Load workspace from specific path"""
-        import json
-        import base64
-        
+    def _read_workspace_file(self, path):
+        """Read and decode a workspace file into its data dict"""
         with open(path, 'rb') as f:
-            file_data = f.read()
+            # Map the file instead of copying it; decryption reads the page cache directly
+            try:
+                file_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                file_data = f.read()  # empty files cannot be mapped
         
         try:
-            data_json = self._decrypt_aes(file_data)
-            workspace_data = json.loads(data_json)
-        except Exception:
-            try:
-                data_json = base64.b64decode(file_data).decode('utf-8')
-                workspace_data = json.loads(data_json)
-            except Exception as e2:
-                raise Exception(f"Failed to decrypt file: {str(e2)}")
+            # Sniff the format instead of failing a full decrypt first
+            if (file_data[:len(_AEAD_MAGIC)] == _AEAD_MAGIC
+                    or file_data[:len(_FERNET_PREFIX)] == _FERNET_PREFIX):
+                return _json_loads(self._decrypt_aes(file_data))
+            # Oldest format: unencrypted base64 JSON
+            return _json_loads(base64.b64decode(file_data))
+        except Exception as e:
+            raise Exception(f"Failed to decrypt file: {str(e)}")
+        finally:
+            if isinstance(file_data, mmap.mmap):
+                file_data.close()
+    
+    def _load_pgf_from_path(self, path):
+        """Load workspace from specific path"""
+        workspace_data = self._read_workspace_file(path)
         
         self.saved_palettes = workspace_data.get('saved_palettes', [])
+        for entry in self.saved_palettes:
+            entry['colors'] = _canon_colors(entry.get('colors', []))
         self.selected_schemes = workspace_data.get('selected_schemes', ['complementary', 'analogous', 'triadic', 'monochromatic'])
         self.source_type.set(workspace_data.get('source_type', 'hex'))
         self.hex_entry.set(workspace_data.get('hex_entry', '#3498db'))
-        self.current_palettes = workspace_data.get('current_palettes', [])
+        # 1.0 files store palettes as nested lists; 2.0 files pack them (see _serialize_palette)
+        self.current_palettes = [self._normalize_palette(self._deserialize_palette(p))
+                                 for p in workspace_data.get('current_palettes', [])]
         self._saved_counter = workspace_data.get('saved_counter', 0)
         self._saved_selected = workspace_data.get('saved_selected', None)
         
@@ -2889,37 +3394,37 @@ class PaletteApp(ctk.CTk):
             self.clear_palette_display()
             source_type = self.source_type.get()
             if source_type == 'hex' and self.current_palettes:
-                self.display_single_palette(self.current_palettes[0])
+                self._render_palette_display(self.display_single_palette, self.current_palettes[0])
             elif source_type == 'image' and self.current_palettes:
-                self.display_multiple_palettes(self.current_palettes)
+                self._render_palette_display(self.display_multiple_palettes, self.current_palettes)
         
         self.current_file = path
         self.is_modified = False
+        self._last_saved_hash = None
         self.update_title()
         
         self.add_recent_file(path)
-        messagebox.showinfo(self.lang.get('loaded_title'), self.lang.get('msg_workspace_loaded').format(path=path))
+        self._msg('info', 'loaded_title', 'msg_workspace_loaded', path=path)
         self.log_action(f"Loaded workspace: {path}")
 
     # ============== Encryption ==============
-    def _get_encryption_key(self):
-        """Generate encryption key"""
-        passphrase = "ColorPaletteGenerator2025SecretKey"
-        key = hashlib.sha256(passphrase.encode()).digest()
-        import base64
-        return base64.urlsafe_b64encode(key)
-    
     def _encrypt_aes(self, data):
-        """Encrypt data"""
-        key = self._get_encryption_key()
-        f = Fernet(key)
-        return f.encrypt(data.encode('utf-8'))
+        """Encrypt bytes"""
+        nonce = os.urandom(_AEAD_NONCE_SIZE)
+        return _AEAD_MAGIC + nonce + self._aead.encrypt(nonce, data, None)
     
     def _decrypt_aes(self, encrypted_data):
-        """Decrypt data"""
-        key = self._get_encryption_key()
-        f = Fernet(key)
-        return f.decrypt(encrypted_data).decode('utf-8')
+        """Decrypt bytes (AES-GCM, or legacy Fernet for older files)"""
+        if encrypted_data[:len(_AEAD_MAGIC)] == _AEAD_MAGIC:
+            body = len(_AEAD_MAGIC) + _AEAD_NONCE_SIZE
+            nonce = encrypted_data[len(_AEAD_MAGIC):body]
+            # Zero-copy view of the ciphertext (works for bytes and mmap input)
+            with memoryview(encrypted_data) as view, view[body:] as ciphertext:
+                return self._aead.decrypt(nonce, ciphertext, None)
+        
+        if self._legacy_fernet is None:
+            self._legacy_fernet = Fernet(base64.urlsafe_b64encode(_PGF_KEY))
+        return self._legacy_fernet.decrypt(bytes(encrypted_data))
 
     # ============== Recent Files ==============
     def get_temp_dir(self):
@@ -2940,34 +3445,37 @@ class PaletteApp(ctk.CTk):
     
     def load_recent_files(self):
         """Load recent files"""
+        if self._recent_cache is not None:
+            return list(self._recent_cache)
+        
         try:
-            import json
-            
             path = self.get_recent_files_path()
             if not os.path.exists(path):
+                self._recent_cache = []
                 return []
             
             with open(path, 'rb') as f:
-                encrypted = f.read()
+                data = f.read()
             
-            data = self._decrypt_aes(encrypted)
-            recent_files = json.loads(data)
+            if data.startswith(_AEAD_MAGIC) or data.startswith(_FERNET_PREFIX):
+                # One-shot migration from the old encrypted format
+                recent_files = _json_loads(self._decrypt_aes(data))
+                self.save_recent_files(recent_files)
+            else:
+                recent_files = data.decode('utf-8').splitlines()
             
-            return [f for f in recent_files if os.path.exists(f)]
+            self._recent_cache = [f for f in recent_files if f and os.path.exists(f)]
+            return list(self._recent_cache)
         except Exception:
             return []
     
     def save_recent_files(self, recent_files):
-        """Save recent files"""
+        """Save recent files (plain text, one path per line)"""
+        self._recent_cache = list(recent_files)
         try:
-            import json
-            
-            data = json.dumps(recent_files)
-            encrypted = self._encrypt_aes(data)
-            
             path = self.get_recent_files_path()
-            with open(path, 'wb') as f:
-                f.write(encrypted)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(recent_files))
         except Exception:
             pass
     
@@ -2986,13 +3494,10 @@ class PaletteApp(ctk.CTk):
     def load_recent_file(self, filepath):
         """Load recent file"""
         if not os.path.exists(filepath):
-            messagebox.showerror(self.lang.get('error'), self.lang.get('msg_file_not_found_path').format(path=filepath))
+            self._msg('error', 'error', 'msg_file_not_found_path', path=filepath)
             return
         
-        try:
-            self._load_pgf_from_path(filepath)
-        except Exception as e:
-            messagebox.showerror(self.lang.get('load_error_title'), self.lang.get('msg_load_failed').format(error=str(e)))
+        self._load_workspace_from_path(filepath)
 
     # ============== Utility Functions ==============
     def update_title(self):
@@ -3027,71 +3532,116 @@ class PaletteApp(ctk.CTk):
             self.is_modified = True
             self.update_title()
 
-    def create_tooltip(self, widget, text):
-        """Create tooltip with delayed show and proper after_cancel - main.py style"""
-        tooltip_window = [None]
-        show_after_id = [None]
-        
-        def destroy_tooltip():
-            if tooltip_window[0] is not None:
-                try:
-                    if tooltip_window[0] in self.active_tooltips:
-                        self.active_tooltips.remove(tooltip_window[0])
-                    tooltip_window[0].destroy()
-                except Exception:
-                    pass
-                tooltip_window[0] = None
-        
-        def show_tooltip(x_root, y_root):
-            destroy_tooltip()
+    # ============== Tooltips ==============
+    def _ensure_tooltip(self):
+        """Create the shared tooltip window once; it is withdrawn while hidden"""
+        tip = self._shared_tooltip
+        if tip is None or not tip.winfo_exists():
             tip = ctk.CTkToplevel(self)
+            tip.withdraw()
             tip.wm_overrideredirect(True)
             try:
                 tip.wm_attributes('-topmost', True)
             except Exception:
                 pass
-            tip.wm_geometry(f"+{x_root + 10}+{y_root + 10}")
             tip.configure(fg_color=COLORS['bg_card'])
             
-            label = ctk.CTkLabel(
+            tip.label = ctk.CTkLabel(
                 tip,
-                text=text,
+                text="",
                 font=ctk.CTkFont(family=FONT_FAMILY, size=10),
                 text_color=COLORS['text_primary']
             )
-            label.pack(padx=8, pady=4)
-            tooltip_window[0] = tip
-            self.active_tooltips.append(tip)
-        
-        def on_enter(e):
-            if show_after_id[0] is not None:
-                try:
-                    widget.after_cancel(show_after_id[0])
-                except Exception:
-                    pass
-                show_after_id[0] = None
-            
-            show_after_id[0] = widget.after(120, lambda: show_tooltip(e.x_root, e.y_root))
-        
-        def on_leave(e):
-            if show_after_id[0] is not None:
-                try:
-                    widget.after_cancel(show_after_id[0])
-                except Exception:
-                    pass
-                show_after_id[0] = None
-            destroy_tooltip()
-        
-        def on_motion(e):
-            if tooltip_window[0] is not None:
-                try:
-                    tooltip_window[0].wm_geometry(f"+{e.x_root + 10}+{e.y_root + 10}")
-                except Exception:
-                    pass
-        
-        widget.bind('<Enter>', on_enter)
-        widget.bind('<Leave>', on_leave)
-        widget.bind('<Motion>', on_motion)
+            tip.label.pack(padx=8, pady=4)
+            self._shared_tooltip = tip
+            self._shared_tooltip_visible = False
+        return tip
+    
+    def _show_shared_tooltip(self, x_root, y_root, text):
+        """Show the shared tooltip with text near the pointer"""
+        try:
+            tip = self._ensure_tooltip()
+            if tip.label.cget('text') != text:
+                tip.label.configure(text=text)
+            tip.wm_geometry(f"+{x_root + 10}+{y_root + 10}")
+            if not self._shared_tooltip_visible:
+                tip.deiconify()
+                tip.lift()
+                self._shared_tooltip_visible = True
+        except Exception:
+            pass
+    
+    def _move_shared_tooltip(self, x_root, y_root):
+        """Follow the pointer while the shared tooltip is visible (at most once per frame)"""
+        if self._shared_tooltip_visible:
+            self._tooltip_pending_pos = (x_root, y_root)
+            if self._tooltip_move_job is None:
+                self._tooltip_move_job = self.after(16, self._flush_tooltip_move)
+    
+    def _flush_tooltip_move(self):
+        """Apply the latest pointer position queued by _move_shared_tooltip"""
+        self._tooltip_move_job = None
+        if self._shared_tooltip_visible and self._tooltip_pending_pos is not None:
+            x_root, y_root = self._tooltip_pending_pos
+            self._tooltip_pending_pos = None
+            try:
+                self._shared_tooltip.wm_geometry(f"+{x_root + 10}+{y_root + 10}")
+            except Exception:
+                pass
+    
+    def _hide_shared_tooltip(self):
+        """Hide (withdraw) the shared tooltip"""
+        self._tooltip_pending_pos = None
+        if self._shared_tooltip_visible:
+            self._shared_tooltip_visible = False
+            try:
+                self._shared_tooltip.withdraw()
+            except Exception:
+                pass
+    
+    def create_tooltip(self, widget, text):
+        """Attach a delayed tooltip to widget; all tooltips share one window and one set of handlers"""
+        widget.tooltip_text = text
+        widget.tooltip_show_job = None
+        widget.bind('<Enter>', self._on_tooltip_enter)
+        widget.bind('<Leave>', self._on_tooltip_leave)
+        widget.bind('<Motion>', self._on_tooltip_motion)
+    
+    def _tooltip_owner_from_event(self, e):
+        """Find the widget that create_tooltip was called on (CTk binds its inner canvas)"""
+        w = e.widget
+        while w is not None and not hasattr(w, 'tooltip_text'):
+            w = getattr(w, 'master', None)
+        return w
+    
+    def _cancel_tooltip_show(self, owner):
+        """Cancel a pending delayed tooltip show for owner"""
+        if owner.tooltip_show_job is not None:
+            try:
+                owner.after_cancel(owner.tooltip_show_job)
+            except Exception:
+                pass
+            owner.tooltip_show_job = None
+    
+    def _on_tooltip_enter(self, e):
+        """Schedule the tooltip after a short hover delay"""
+        owner = self._tooltip_owner_from_event(e)
+        if owner is None:
+            return
+        self._cancel_tooltip_show(owner)
+        owner.tooltip_show_job = owner.after(120, self._show_shared_tooltip, e.x_root, e.y_root,
+                                             owner.tooltip_text)
+    
+    def _on_tooltip_leave(self, e):
+        """Cancel a pending show and hide the tooltip"""
+        owner = self._tooltip_owner_from_event(e)
+        if owner is not None:
+            self._cancel_tooltip_show(owner)
+        self._hide_shared_tooltip()
+    
+    def _on_tooltip_motion(self, e):
+        """Keep the tooltip next to the pointer"""
+        self._move_shared_tooltip(e.x_root, e.y_root)
 
     def setup_logging(self):
         """Setup logging"""
@@ -3115,7 +3665,13 @@ class PaletteApp(ctk.CTk):
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
         
-        logger.addHandler(file_handler)
+        # Records are buffered in memory and written out together by _flush_log
+        # (errors, a full buffer and interpreter shutdown flush immediately)
+        self._log_buffer = logging.handlers.MemoryHandler(
+            capacity=100, flushLevel=logging.ERROR, target=file_handler
+        )
+        self._log_flush_job = None
+        logger.addHandler(self._log_buffer)
         
         self.logger = logger
         self.logger.info("="*50)
@@ -3124,16 +3680,17 @@ class PaletteApp(ctk.CTk):
     def _init_preset_palettes_async(self):
         """Initialize preset palettes in background"""
         try:
-            preset_file = os.path.join('data', 'preset_palettes.dat')
-            if os.path.exists(preset_file):
-                return
-            
-            logging.info("Preset palettes not found. Generating in background...")
-            
             import threading
             
             def generate_presets():
                 try:
+                    # Existence check runs here too, keeping startup free of disk I/O
+                    preset_file = os.path.join('data', 'preset_palettes.dat')
+                    if os.path.exists(preset_file):
+                        return
+                    
+                    logging.info("Preset palettes not found. Generating in background...")
+                    
                     from preset_generator import PresetPaletteGenerator
                     generator = PresetPaletteGenerator()
                     palettes = generator.generate_all_palettes(count=1200)
@@ -3142,17 +3699,27 @@ class PaletteApp(ctk.CTk):
                 except Exception as e:
                     logging.error(f"Failed to generate preset palettes: {e}")
             
-            thread = threading.Thread(target=generate_presets, daemon=True)
+            thread = threading.Thread(target=generate_presets, name='preset-gen', daemon=True)
             thread.start()
             
         except Exception as e:
             logging.error(f"Error initializing preset palettes: {e}")
     
     def log_action(self, action):
-        """Log an action"""
+        """Log an action (written to disk by a short flush timer)"""
         try:
             if hasattr(self, 'logger'):
                 self.logger.info(action)
+                if self._log_flush_job is None:
+                    self._log_flush_job = self.after(250, self._flush_log)
+        except Exception:
+            pass
+    
+    def _flush_log(self):
+        """Write buffered log records to the log file in one go"""
+        self._log_flush_job = None
+        try:
+            self._log_buffer.flush()
         except Exception:
             pass
     
@@ -3204,7 +3771,7 @@ class PaletteApp(ctk.CTk):
                         self.on_source_change()
                         self.log_action(f"Image dropped: {os.path.basename(file_path)}")
                     elif file_path.lower().endswith('.pgf'):
-                        self._load_pgf_from_path(file_path)
+                        self._load_workspace_from_path(file_path)
             
             self.drop_target_register('DND_Files')
             self.dnd_bind('<<Drop>>', on_drop)
@@ -3246,11 +3813,66 @@ class PaletteApp(ctk.CTk):
                     return
         
         self.log_action("Application closed")
+        if self._ai_jobs is not None:
+            self._ai_jobs.put(None)
+        if self._log_flush_job is not None:
+            self.after_cancel(self._log_flush_job)
+        self._flush_log()
         self.destroy()
 
     # ============== Stub methods for features to be implemented ==============
     def rename_palette(self, idx):
-        """Rename palette"""
+        """Rename palette (inline in its row, dialog if the row is not shown)"""
+        row = self._palette_widgets.get(idx)
+        if row is None:
+            self._rename_palette_dialog(idx)
+            return
+        
+        rename_entry = row.get('rename_entry')
+        if rename_entry is not None:
+            rename_entry.focus_set()
+            return
+        
+        palette = self.saved_palettes[idx]
+        old_name = palette['name']
+        name_label = row['name_label']
+        rename_entry = ctk.CTkEntry(
+            row['header'],
+            height=24,
+            font=ctk.CTkFont(family=FONT_FAMILY, size=11, weight="bold")
+        )
+        rename_entry.insert(0, old_name)
+        name_label.pack_forget()
+        rename_entry.pack(side='left', fill='x', expand=True, padx=(0, 8))
+        rename_entry.select_range(0, 'end')
+        rename_entry.focus_set()
+        row['rename_entry'] = rename_entry
+        
+        def finish(commit):
+            if row.get('rename_entry') is not rename_entry:
+                return
+            row['rename_entry'] = None
+            row['rename_finish'] = None
+            new_name = rename_entry.get().strip()
+            rename_entry.destroy()
+            name_label.pack(side='left')
+            
+            if commit and new_name and new_name != old_name:
+                # The list may have changed while editing; skip a deleted palette
+                if not any(p is palette for p in self.saved_palettes):
+                    return
+                palette['name'] = new_name
+                self.render_saved_list()
+                self.mark_modified()
+                self.log_action(f"Renamed palette: {old_name} -> {new_name}")
+        
+        rename_entry.bind('<Return>', lambda e: finish(True))
+        rename_entry.bind('<FocusOut>', lambda e: finish(True))
+        rename_entry.bind('<Escape>', lambda e: finish(False))
+        row['rename_finish'] = finish
+
+    def _rename_palette_dialog(self, idx):
+        """Rename palette through an input dialog"""
         try:
             entry = self.saved_palettes[idx]
             old_name = entry['name']
@@ -3261,8 +3883,8 @@ class PaletteApp(ctk.CTk):
             )
             new_name = dialog.get_input()
             
-            if new_name:
-                self.saved_palettes[idx]['name'] = new_name
+            if new_name and any(p is entry for p in self.saved_palettes):
+                entry['name'] = new_name
                 self.render_saved_list()
                 self.mark_modified()
                 self.log_action(f"Renamed palette: {old_name} -> {new_name}")
@@ -3277,6 +3899,7 @@ class PaletteApp(ctk.CTk):
         entry = self.saved_palettes[idx]
         
         dialog = ctk.CTkToplevel(self)
+        self._scope_scroll_bindings(dialog)
         set_window_icon(dialog)
         dialog.title(self.lang.get('palette_editor_title').format(name=entry['name']))
         dialog.geometry("600x500")
@@ -3310,130 +3933,168 @@ class PaletteApp(ctk.CTk):
         toolbar = ctk.CTkFrame(dialog, fg_color="transparent")
         toolbar.pack(fill='x', padx=15, pady=10)
         
-        # Local copy of colors for editing
-        edit_colors = entry['colors'].copy()
-        selected_color_idx = [None]
+        # Edit the palette's list in place; the snapshot is only for cancel
+        edit_colors = entry['colors']
+        original_colors = tuple(edit_colors)
+        state = SimpleNamespace(sel=None)
         
         # Color list frame (create before refresh_color_list)
         color_list_frame = ctk.CTkScrollableFrame(dialog, fg_color=COLORS['bg_card'])
         color_list_frame.pack(fill='both', expand=True, padx=15, pady=10)
         
-        def refresh_color_list():
-            for widget in color_list_frame.winfo_children():
-                widget.destroy()
+        # Pooled color rows, index-aligned with edit_colors
+        color_rows = []
+        # Per-color label texts, so moves and sorts don't re-derive them
+        color_texts = {}
+        
+        def get_color_texts(color):
+            texts = color_texts.get(color)
+            if texts is None:
+                try:
+                    rgb = self.generator.hex_to_rgb(color)
+                    rgb_text = f"RGB({rgb[0]}, {rgb[1]}, {rgb[2]})"
+                except Exception:
+                    rgb_text = ''
+                texts = color_texts[color] = (_canon_hex(color), rgb_text)
+            return texts
+        
+        def fill_color_row(i):
+            """Point row i at edit_colors[i], touching only the widgets that changed"""
+            row = color_rows[i]
+            color = edit_colors[i]
+            if row['color'] != color:
+                row['color'] = color
+                hex_text, rgb_text = get_color_texts(color)
+                row['swatch'].configure(fg_color=color)
+                row['hex_lbl'].configure(text=hex_text)
+                row['rgb_lbl'].configure(text=rgb_text)
+            is_selected = state.sel == i
+            if row['selected'] != is_selected:
+                row['selected'] = is_selected
+                row['frame'].configure(fg_color=COLORS['accent'] if is_selected else COLORS['bg_secondary'])
+        
+        def make_color_row(i):
+            color_row = ctk.CTkFrame(
+                color_list_frame,
+                fg_color=COLORS['bg_secondary'],
+                corner_radius=6,
+                height=45
+            )
+            color_row.pack(fill='x', pady=2)
+            color_row.pack_propagate(False)
+            
+            # Color swatch
+            swatch = ctk.CTkFrame(
+                color_row,
+                width=40,
+                height=35,
+                corner_radius=4
+            )
+            swatch.pack(side='left', padx=10, pady=5)
+            swatch.pack_propagate(False)
             
-            color_count_label.configure(text=self.lang.get('colors_count').format(count=len(edit_colors)))
+            # Color info
+            info_frame = ctk.CTkFrame(color_row, fg_color="transparent")
+            info_frame.pack(side='left', fill='both', expand=True, padx=10)
             
-            for i, color in enumerate(edit_colors):
-                is_selected = selected_color_idx[0] == i
-                
-                color_row = ctk.CTkFrame(
-                    color_list_frame,
-                    fg_color=COLORS['accent'] if is_selected else COLORS['bg_secondary'],
-                    corner_radius=6,
-                    height=45
-                )
-                color_row.pack(fill='x', pady=2)
-                color_row.pack_propagate(False)
-                
-                # Color swatch
-                swatch = ctk.CTkFrame(
-                    color_row,
-                    width=40,
-                    height=35,
-                    corner_radius=4,
-                    fg_color=color
-                )
-                swatch.pack(side='left', padx=10, pady=5)
-                swatch.pack_propagate(False)
-                
-                # Color info
-                info_frame = ctk.CTkFrame(color_row, fg_color="transparent")
-                info_frame.pack(side='left', fill='both', expand=True, padx=10)
-                
-                hex_lbl = ctk.CTkLabel(
-                    info_frame,
-                    text=color.upper(),
-                    font=ctk.CTkFont(family=FONT_FAMILY, size=12, weight="bold"),
-                    text_color=COLORS['text_primary']
-                )
-                hex_lbl.pack(anchor='w')
-                
+            hex_lbl = ctk.CTkLabel(
+                info_frame,
+                text='',
+                font=self._get_font(12, "bold"),
+                text_color=COLORS['text_primary']
+            )
+            hex_lbl.pack(anchor='w')
+            
+            rgb_lbl = ctk.CTkLabel(
+                info_frame,
+                text='',
+                font=self._get_font(10),
+                text_color=COLORS['text_secondary']
+            )
+            rgb_lbl.pack(anchor='w')
+            
+            # Select on click
+            for w in [color_row, swatch, info_frame, hex_lbl]:
+                w.bind('<Button-1>', lambda e, color_idx=i: select_color(color_idx))
                 try:
-                    rgb = self.generator.hex_to_rgb(color)
-                    rgb_lbl = ctk.CTkLabel(
-                        info_frame,
-                        text=f"RGB({rgb[0]}, {rgb[1]}, {rgb[2]})",
-                        font=ctk.CTkFont(family=FONT_FAMILY, size=10),
-                        text_color=COLORS['text_secondary']
-                    )
-                    rgb_lbl.pack(anchor='w')
+                    w.configure(cursor='hand2')
                 except Exception:
                     pass
-                
-                # Select on click
-                def make_select(color_idx):
-                    def handler(e=None):
-                        selected_color_idx[0] = color_idx
-                        refresh_color_list()
-                    return handler
-                
-                for w in [color_row, swatch, info_frame, hex_lbl]:
-                    w.bind('<Button-1>', make_select(i))
-                    try:
-                        w.configure(cursor='hand2')
-                    except Exception:
-                        pass
+            
+            color_rows.append({
+                'frame': color_row, 'swatch': swatch, 'hex_lbl': hex_lbl, 'rgb_lbl': rgb_lbl,
+                'color': None, 'selected': None,
+            })
+            fill_color_row(i)
+        
+        def select_color(color_idx):
+            prev = state.sel
+            state.sel = color_idx
+            for i in (prev, color_idx):
+                if i is not None and i < len(color_rows):
+                    fill_color_row(i)
+        
+        def refresh_color_list(changed=None):
+            """Sync pooled rows with edit_colors; pass changed indices to limit the update"""
+            color_count_label.configure(text=self._ui_text.colors_count(count=len(edit_colors)))
+            
+            while len(color_rows) > len(edit_colors):
+                color_rows.pop()['frame'].destroy()
+            
+            for i in (range(len(color_rows)) if changed is None else changed):
+                fill_color_row(i)
+            for i in range(len(color_rows), len(edit_colors)):
+                make_color_row(i)
         
         # Add color button
         def add_color():
             color_result = colorchooser.askcolor(title=self.lang.get('add_color_title'))
             if color_result[1]:
-                edit_colors.append(color_result[1])
+                edit_colors.append(_canon_hex(color_result[1]))
                 refresh_color_list()
         
         ModernButton(toolbar, text=f"➕ {self.lang.get('add_color')}", command=add_color, width=100).pack(side='left', padx=2)
         
         # Edit color button
         def edit_selected_color():
-            if selected_color_idx[0] is None:
-                messagebox.showinfo(self.lang.get('selection_required'), self.lang.get('select_color_first'))
+            if state.sel is None:
+                self._msg('info', 'selection_required', 'select_color_first')
                 return
-            current_color = edit_colors[selected_color_idx[0]]
+            current_color = edit_colors[state.sel]
             color_result = colorchooser.askcolor(color=current_color, title=self.lang.get('edit_color_title'))
             if color_result[1]:
-                edit_colors[selected_color_idx[0]] = color_result[1]
-                refresh_color_list()
+                edit_colors[state.sel] = color_result[1]
+                refresh_color_list((state.sel,))
         
         ModernSecondaryButton(toolbar, text=f"✏️ {self.lang.get('edit')}", command=edit_selected_color, width=80).pack(side='left', padx=2)
         
         # Delete color button
         def delete_selected_color():
-            if selected_color_idx[0] is None:
-                messagebox.showinfo(self.lang.get('selection_required'), self.lang.get('select_color_first'))
+            if state.sel is None:
+                self._msg('info', 'selection_required', 'select_color_first')
                 return
-            del edit_colors[selected_color_idx[0]]
-            selected_color_idx[0] = None
+            del edit_colors[state.sel]
+            state.sel = None
             refresh_color_list()
         
         ModernSecondaryButton(toolbar, text=f" {self.lang.get('delete')}", image=self._get_icon('delete'), compound='left', command=delete_selected_color, width=80).pack(side='left', padx=2)
         
         # Move buttons
         def move_up():
-            if selected_color_idx[0] is None or selected_color_idx[0] == 0:
+            if state.sel is None or state.sel == 0:
                 return
-            i = selected_color_idx[0]
+            i = state.sel
             edit_colors[i], edit_colors[i-1] = edit_colors[i-1], edit_colors[i]
-            selected_color_idx[0] = i - 1
-            refresh_color_list()
+            state.sel = i - 1
+            refresh_color_list((i - 1, i))
         
         def move_down():
-            if selected_color_idx[0] is None or selected_color_idx[0] >= len(edit_colors) - 1:
+            if state.sel is None or state.sel >= len(edit_colors) - 1:
                 return
-            i = selected_color_idx[0]
+            i = state.sel
             edit_colors[i], edit_colors[i+1] = edit_colors[i+1], edit_colors[i]
-            selected_color_idx[0] = i + 1
-            refresh_color_list()
+            state.sel = i + 1
+            refresh_color_list((i, i + 1))
         
         ModernIconButton(toolbar, text="\u2b06\ufe0f", command=move_up, width=36).pack(side='left', padx=2)
         ModernIconButton(toolbar, text="\u2b07\ufe0f", command=move_down, width=36).pack(side='left', padx=2)
@@ -3442,29 +4103,51 @@ class PaletteApp(ctk.CTk):
         sort_frame = ctk.CTkFrame(toolbar, fg_color="transparent")
         sort_frame.pack(side='right')
         
-        def sort_by_hue():
-            def get_hue(hex_color):
-                rgb = self.generator.hex_to_rgb(hex_color)
-                h, s, v = colorsys.rgb_to_hsv(rgb[0]/255, rgb[1]/255, rgb[2]/255)
-                return h
-            edit_colors.sort(key=get_hue)
+        # Sort keys are computed for the whole palette at once with NumPy
+        def reorder(order):
+            order = order.tolist()
+            if order == list(range(len(order))):
+                return  # already in this order
+            edit_colors[:] = [edit_colors[i] for i in order]
             refresh_color_list()
         
+        def reorder_by(keys):
+            reorder(np.argsort(keys, kind='stable'))
+        
+        def sort_by_hue():
+            if not edit_colors:
+                return
+            reorder_by(_hue_array(_hex_array(edit_colors).astype(np.float64)))
+        
+        def sort_by_color_family():
+            # HLS: 12 hue buckets (grays first), then lightness, then saturation within a bucket
+            if not edit_colors:
+                return
+            rgb = _hex_array(edit_colors).astype(np.float64)
+            mx = rgb.max(axis=1)
+            mn = rgb.min(axis=1)
+            d = mx - mn
+            lightness = (mx + mn) / 510.0
+            denom = np.where(lightness <= 0.5, mx + mn, 510.0 - mx - mn)
+            saturation = np.where(d == 0, 0.0, d / np.where(denom == 0, 1.0, denom))
+            bucket = np.where(d == 0, -1, np.rint(_hue_array(rgb) * 12) % 12)
+            # lexsort is stable and uses the last key as the primary one
+            reorder(np.lexsort((saturation, lightness, bucket)))
+        
         def sort_by_saturation():
-            def get_saturation(hex_color):
-                rgb = self.generator.hex_to_rgb(hex_color)
-                h, s, v = colorsys.rgb_to_hsv(rgb[0]/255, rgb[1]/255, rgb[2]/255)
-                return s
-            edit_colors.sort(key=get_saturation, reverse=True)
-            refresh_color_list()
+            if not edit_colors:
+                return
+            rgb = _hex_array(edit_colors).astype(np.float64)
+            mx = rgb.max(axis=1)
+            sat = np.where(mx == 0, 0.0, (mx - rgb.min(axis=1)) / np.where(mx == 0, 1.0, mx))
+            reorder_by(-sat)
         
         def sort_by_value():
-            def get_value(hex_color):
-                rgb = self.generator.hex_to_rgb(hex_color)
-                return 0.299*rgb[0] + 0.587*rgb[1] + 0.114*rgb[2]
-            edit_colors.sort(key=get_value)
-            refresh_color_list()
+            if not edit_colors:
+                return
+            reorder_by(_hex_array(edit_colors) @ np.array([0.299, 0.587, 0.114]))
         
+        ModernSecondaryButton(sort_frame, text=self.lang.get('sort_by_color_family'), command=sort_by_color_family, width=70).pack(side='left', padx=2)
         ModernSecondaryButton(sort_frame, text=self.lang.get('sort_by_hue'), command=sort_by_hue, width=70).pack(side='left', padx=2)
         ModernSecondaryButton(sort_frame, text=self.lang.get('sort_by_saturation'), command=sort_by_saturation, width=70).pack(side='left', padx=2)
         ModernSecondaryButton(sort_frame, text=self.lang.get('sort_by_luminance'), command=sort_by_value, width=70).pack(side='left', padx=2)
@@ -3476,14 +4159,22 @@ class PaletteApp(ctk.CTk):
         btn_frame.pack(fill='x', padx=15, pady=15)
         
         def save_changes():
-            entry['colors'] = edit_colors.copy()
             self.render_saved_list()
             self.mark_modified()
             self.log_action(f"Updated palette: {entry['name']}")
             dialog.destroy()
         
+        def cancel_changes():
+            if tuple(edit_colors) != original_colors:
+                edit_colors[:] = original_colors
+                # An auto-save may have caught the edits mid-session
+                self.mark_modified()
+            dialog.destroy()
+        
+        dialog.protocol('WM_DELETE_WINDOW', cancel_changes)
+        
         ModernButton(btn_frame, text=self.lang.get('button_save'), command=save_changes, width=100).pack(side='left', padx=5)
-        ModernSecondaryButton(btn_frame, text=self.lang.get('button_cancel'), command=dialog.destroy, width=100).pack(side='left', padx=5)
+        ModernSecondaryButton(btn_frame, text=self.lang.get('button_cancel'), command=cancel_changes, width=100).pack(side='left', padx=5)
 
     def save_palette_file(self, idx):
         """Save palette file"""
@@ -3495,17 +4186,14 @@ class PaletteApp(ctk.CTk):
                 initialfile=entry['name']
             )
             if filename:
-                import json
-                import base64
-                data = json.dumps({'name': entry['name'], 'colors': entry['colors']})
-                encoded = base64.b64encode(data.encode('utf-8')).decode('utf-8')
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(encoded)
+                # Base64 of UTF-8 JSON, encoded bytes-to-bytes and written in one go
+                data = _json_dumps({'name': entry['name'], 'colors': entry['colors']})
+                self._write_file_atomic(filename, base64.b64encode(data))
                 
                 self.file_handler.add_palette_metadata(entry['name'], entry['colors'], filename)
                 self.log_action(f"Saved palette to MPS: {entry['name']}")
         except Exception as e:
-            messagebox.showerror(self.lang.get('save_error_title'), self.lang.get('msg_save_failed').format(error=str(e)))
+            self._msg('error', 'save_error_title', 'msg_save_failed', error=str(e))
 
     def toggle_palette_view(self, idx):
         """Toggle palette view mode"""
@@ -3513,7 +4201,8 @@ class PaletteApp(ctk.CTk):
             entry = self.saved_palettes[idx]
             current_mode = entry.get('view_mode', 'rgb')
             entry['view_mode'] = 'value' if current_mode == 'rgb' else 'rgb'
-            self.render_saved_list()
+            # Only this palette's bar changes
+            self._update_single_palette_entry(idx)
         except Exception as e:
             messagebox.showerror(self.lang.get('error'), str(e))
 
@@ -3523,7 +4212,7 @@ class PaletteApp(ctk.CTk):
             entry = self.saved_palettes[idx]
             colors = entry.get('colors', [])
             if not colors:
-                messagebox.showinfo(self.lang.get('export_title'), self.lang.get('msg_palette_has_no_colors'))
+                self._msg('info', 'export_title', 'msg_palette_has_no_colors')
                 return
             
             filename = filedialog.asksaveasfilename(
@@ -3532,11 +4221,11 @@ class PaletteApp(ctk.CTk):
                 initialfile=f"{entry['name']}.txt"
             )
             if filename:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(f"Palette: {entry['name']}\n")
-                    f.write(f"Colors: {len(colors)}\n\n")
-                    for i, color in enumerate(colors, 1):
-                        f.write(f"{i}. {color}\n")
+                # Build the whole file in memory and hand it over in one write
+                parts = [f"Palette: {entry['name']}\n", f"Colors: {len(colors)}\n\n"]
+                parts.extend(f"{i}. {color}\n" for i, color in enumerate(colors, 1))
+                
+                self._write_file_atomic(filename, ''.join(parts).encode('utf-8'))
                 messagebox.showinfo(self.lang.get('saved_title'), f"Exported to {filename}")
         except Exception as e:
             messagebox.showerror(self.lang.get('error'), str(e))
@@ -3547,7 +4236,7 @@ class PaletteApp(ctk.CTk):
             entry = self.saved_palettes[idx]
             colors = entry.get('colors', [])
             if not colors:
-                messagebox.showinfo(self.lang.get('export_title'), self.lang.get('msg_palette_has_no_colors'))
+                self._msg('info', 'export_title', 'msg_palette_has_no_colors')
                 return
             
             filename = filedialog.asksaveasfilename(
@@ -3560,15 +4249,14 @@ class PaletteApp(ctk.CTk):
                 img_width = color_width * len(colors)
                 img_height = 100
                 
-                img = Image.new('RGB', (img_width, img_height))
-                draw = ImageDraw.Draw(img)
+                # Build one scanline of widened swatches, then repeat it for every row;
+                # the raw buffer goes to PIL as-is with no intermediate pixel arrays
+                rgb = _hex_array(colors).tobytes()
+                row = b''.join(rgb[i:i + 3] * color_width for i in range(0, len(rgb), 3))
+                img = Image.frombytes('RGB', (img_width, img_height), row * img_height)
                 
-                for i, color in enumerate(colors):
-                    x0 = i * color_width
-                    x1 = x0 + color_width
-                    draw.rectangle([x0, 0, x1, img_height], fill=color)
-                
-                img.save(filename)
+                # Flat color blocks compress well even at the fastest zlib level
+                img.save(filename, compress_level=1)
                 messagebox.showinfo(self.lang.get('saved_title'), f"Exported to {filename}")
         except Exception as e:
             messagebox.showerror(self.lang.get('error'), str(e))
@@ -3576,18 +4264,18 @@ class PaletteApp(ctk.CTk):
     def open_color_adjuster(self):
         """Open color adjuster dialog for the selected palette"""
         if self._saved_selected is None:
-            messagebox.showinfo(self.lang.get('selection_required'), self.lang.get('select_palette_to_adjust'))
+            self._msg('info', 'selection_required', 'select_palette_to_adjust')
             return
         
         if not COLOR_ADJUSTER_AVAILABLE:
-            messagebox.showwarning(self.lang.get('warning'), self.lang.get('msg_color_adjust_unavailable'))
+            self._msg('warning', 'warning', 'msg_color_adjust_unavailable')
             return
         
         entry = self.saved_palettes[self._saved_selected]
         colors = entry.get('colors', [])
         
         if not colors:
-            messagebox.showinfo(self.lang.get('info'), self.lang.get('msg_palette_has_no_colors'))
+            self._msg('info', 'info', 'msg_palette_has_no_colors')
             return
         
         dialog = ctk.CTkToplevel(self)
@@ -3615,18 +4303,22 @@ class PaletteApp(ctk.CTk):
         
         preview_colors = colors.copy()
         
-        def update_preview():
-            for widget in preview_frame.winfo_children():
-                widget.destroy()
-            for color in preview_colors:
-                swatch = ctk.CTkFrame(
-                    preview_frame,
-                    fg_color=color,
-                    corner_radius=4
-                )
-                swatch.pack(side='left', fill='both', expand=True, padx=2, pady=5)
+        # One swatch per color, created once and recolored as the sliders move
+        preview_swatches = []
+        for color in preview_colors:
+            swatch = ctk.CTkFrame(
+                preview_frame,
+                fg_color=color,
+                corner_radius=4
+            )
+            swatch.pack(side='left', fill='both', expand=True, padx=2, pady=5)
+            preview_swatches.append([swatch, color])
         
-        update_preview()
+        def update_preview():
+            for item, color in zip(preview_swatches, preview_colors):
+                if item[1] != color:
+                    item[1] = color
+                    item[0].configure(fg_color=color)
         
         # Contrast slider
         contrast_frame = ctk.CTkFrame(dialog, fg_color="transparent")
@@ -3690,6 +4382,15 @@ class PaletteApp(ctk.CTk):
         )
         warmth_value_label.pack(anchor='e')
         
+        # The source colors never change while the dialog is open; parse them once
+        rgb_to_hex = self.generator.rgb_to_hex
+        # A regex gate up front, instead of an exception per invalid color on every tick
+        hex_to_rgb = self.generator.hex_to_rgb
+        source_rgbs = [
+            (color, hex_to_rgb(color) if isinstance(color, str) and _HEX_RE.fullmatch(color) else None)
+            for color in colors
+        ]
+        
         def on_slider_change(*args):
             nonlocal preview_colors
             contrast = contrast_var.get()
@@ -3699,14 +4400,16 @@ class PaletteApp(ctk.CTk):
             warmth_value_label.configure(text=f"{int(warmth * 100)}%")
             
             adjusted = []
-            for color in colors:
+            for color, rgb in source_rgbs:
+                if rgb is None:
+                    adjusted.append(color)
+                    continue
                 try:
-                    rgb = self.generator.hex_to_rgb(color)
                     if apply_contrast and contrast != 0:
                         rgb = apply_contrast(rgb, contrast)
                     if apply_warmth and warmth != 0:
                         rgb = apply_warmth(rgb, warmth)
-                    adjusted.append(self.generator.rgb_to_hex(rgb))
+                    adjusted.append(rgb_to_hex(rgb))
                 except Exception:
                     adjusted.append(color)
             
@@ -3738,7 +4441,7 @@ class PaletteApp(ctk.CTk):
     def apply_palette_to_image(self):
         """Apply palette to image - opens the Image Recolorer dialog"""
         if not self.saved_palettes or all(len(p.get('colors', [])) == 0 for p in self.saved_palettes):
-            messagebox.showinfo(self.lang.get('info'), self.lang.get('msg_no_valid_colors'))
+            self._msg('info', 'info', 'msg_no_valid_colors')
             return
         
         dialog = ctk.CTkToplevel(self)
@@ -3752,6 +4455,8 @@ class PaletteApp(ctk.CTk):
         # State
         current_image_path = [None]
         current_preview = [None]
+        preview_source = [None]  # preview-sized copy of the loaded image
+        applied_colors = [None]  # palette behind current_preview, re-applied at full size on save
         recolorer = ImageRecolorer()
         
         # Left panel - Controls
@@ -3789,39 +4494,38 @@ class PaletteApp(ctk.CTk):
         palette_preview_frame.pack(fill='x', padx=15, pady=10)
         palette_preview_frame.pack_propagate(False)
         
+        # One preview canvas for the dialog's lifetime; selection changes only redraw it
+        preview_bar = tk.Canvas(
+            palette_preview_frame,
+            height=40,
+            bg=COLORS['bg_card'],
+            highlightthickness=0
+        )
+        preview_bar._display_colors = ()
+        preview_bar._bar_height = 40
+        # Drawn from <Configure> with the real width, no forced layout pass
+        preview_bar.bind('<Configure>', self._on_palette_bar_configure)
+        
         def update_palette_preview(*args):
-            for widget in palette_preview_frame.winfo_children():
-                widget.destroy()
-            
             name = selected_palette_var.get()
+            colors = ()
             for p in self.saved_palettes:
                 if p['name'] == name:
-                    colors = p.get('colors', [])[:10]
-                    if colors:
-                        # Use Canvas for precise width calculation
-                        canvas = tk.Canvas(
-                            palette_preview_frame,
-                            height=40,
-                            bg=COLORS['bg_card'],
-                            highlightthickness=0
-                        )
-                        canvas.pack(fill='both', expand=True)
-                        
-                        def draw_preview():
-                            canvas.delete('all')
-                            canvas.update_idletasks()
-                            canvas_width = canvas.winfo_width()
-                            if canvas_width <= 1:
-                                canvas_width = 400
-                            
-                            box_width = float(canvas_width) / float(len(colors))
-                            for i, color in enumerate(colors):
-                                x1 = int(i * box_width)
-                                x2 = int((i + 1) * box_width)
-                                canvas.create_rectangle(x1, 0, x2, 40, fill=color, outline='')
-                        
-                        canvas.after(50, draw_preview)
+                    colors = tuple(p.get('colors', [])[:10])
                     break
+            
+            if colors == preview_bar._display_colors:
+                return
+            preview_bar._display_colors = colors
+            if not colors:
+                preview_bar.pack_forget()
+                return
+            drawn_width = getattr(preview_bar, '_drawn_width', None)
+            if drawn_width:
+                # Already laid out once; <Configure> redraws again if the width changed
+                self._draw_palette_bar(preview_bar, drawn_width)
+            if not preview_bar.winfo_ismapped():
+                preview_bar.pack(fill='both', expand=True)
         
         selected_palette_var.trace_add('write', update_palette_preview)
         update_palette_preview()
@@ -3840,11 +4544,15 @@ class PaletteApp(ctk.CTk):
             )
             if path:
                 current_image_path[0] = path
+                current_preview[0] = None
+                applied_colors[0] = None
+                preview_source[0] = None
                 try:
                     img = Image.open(path)
-                    # Resize for preview
+                    # Resize for preview; thumbnail() drafts JPEGs, so libjpeg decodes at reduced scale
                     max_size = (500, 400)
                     img.thumbnail(max_size, Image.Resampling.LANCZOS)
+                    preview_source[0] = img
                     photo = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
                     image_label.configure(image=photo, text="")
                     image_label.image = photo
@@ -3852,7 +4560,7 @@ class PaletteApp(ctk.CTk):
                     # Show filename
                     file_label.configure(text=os.path.basename(path))
                 except Exception as e:
-                    messagebox.showerror(self.lang.get('error'), self.lang.get('msg_recolor_load_image_failed').format(error=str(e)))
+                    self._msg('error', 'error', 'msg_recolor_load_image_failed', error=str(e))
         
         ModernButton(
             left_panel,
@@ -3873,8 +4581,8 @@ class PaletteApp(ctk.CTk):
         
         # Apply button
         def apply_recolor():
-            if not current_image_path[0]:
-                messagebox.showinfo(self.lang.get('info'), self.lang.get('msg_select_image_first'))
+            if not current_image_path[0] or preview_source[0] is None:
+                self._msg('info', 'info', 'msg_select_image_first')
                 return
             
             name = selected_palette_var.get()
@@ -3885,24 +4593,24 @@ class PaletteApp(ctk.CTk):
                     break
             
             if not colors:
-                messagebox.showinfo(self.lang.get('info'), self.lang.get('msg_palette_has_no_colors'))
+                self._msg('info', 'info', 'msg_palette_has_no_colors')
                 return
             
             try:
-                result_img = recolorer.apply_palette_to_image(current_image_path[0], colors)
-                current_preview[0] = result_img
+                # Recolor the preview-sized image only; the full-size image is
+                # decoded and recolored when the result is saved
+                preview = recolorer.apply_palette_to_pil_image(preview_source[0], colors)
+                current_preview[0] = preview
+                applied_colors[0] = list(colors)
                 
                 # Show preview
-                preview = result_img.copy()
-                max_size = (500, 400)
-                preview.thumbnail(max_size, Image.Resampling.LANCZOS)
                 photo = ctk.CTkImage(light_image=preview, dark_image=preview, size=preview.size)
                 image_label.configure(image=photo, text="")
                 image_label.image = photo
                 
                 self.log_action(f"Applied palette to image: {os.path.basename(current_image_path[0])}")
             except Exception as e:
-                messagebox.showerror(self.lang.get('error'), self.lang.get('msg_recolor_preview_failed').format(error=str(e)))
+                self._msg('error', 'error', 'msg_recolor_preview_failed', error=str(e))
         
         ModernButton(
             left_panel,
@@ -3916,7 +4624,7 @@ class PaletteApp(ctk.CTk):
         # Save button
         def save_result():
             if not current_preview[0]:
-                messagebox.showinfo(self.lang.get('info'), self.lang.get('msg_no_preview'))
+                self._msg('info', 'info', 'msg_no_preview')
                 return
             
             save_path = filedialog.asksaveasfilename(
@@ -3926,10 +4634,11 @@ class PaletteApp(ctk.CTk):
             )
             if save_path:
                 try:
-                    current_preview[0].save(save_path)
-                    messagebox.showinfo(self.lang.get('saved_title'), self.lang.get('msg_recolor_save_success').format(path=save_path))
+                    result_img = recolorer.apply_palette_to_image(current_image_path[0], applied_colors[0])
+                    result_img.save(save_path)
+                    self._msg('info', 'saved_title', 'msg_recolor_save_success', path=save_path)
                 except Exception as e:
-                    messagebox.showerror(self.lang.get('error'), self.lang.get('msg_recolor_save_failed').format(error=str(e)))
+                    self._msg('error', 'error', 'msg_recolor_save_failed', error=str(e))
         
         ModernSecondaryButton(
             left_panel,
@@ -3969,14 +4678,13 @@ class PaletteApp(ctk.CTk):
         """Open custom harmony editor"""
         try:
             from custom_harmony import CustomHarmonyManager
-            import colorsys
-            from tkinter import colorchooser
             
             # Get current base color
             current_color = self.hex_entry.get() or '#FF0000'
             manager = CustomHarmonyManager(self.file_handler)
             
             dialog = ctk.CTkToplevel(self)
+            self._scope_scroll_bindings(dialog)
             set_window_icon(dialog)
             dialog.title(self.lang.get('dialog_custom_harmony'))
             dialog.geometry("1000x700")
@@ -4018,13 +4726,14 @@ class PaletteApp(ctk.CTk):
                     btn.destroy()
                 harmony_buttons.clear()
                 
+                unnamed = self.lang.get('unnamed')
                 for i, harmony in enumerate(manager.harmonies):
                     def make_select(idx):
                         return lambda: on_harmony_select(idx)
                     
                     btn = ctk.CTkButton(
                         harmony_frame,
-                        text=harmony.get('name', self.lang.get('unnamed')),
+                        text=harmony.get('name', unnamed),
                         command=make_select(i),
                         fg_color=COLORS['bg_hover'],
                         hover_color=COLORS['accent'],
@@ -4067,7 +4776,7 @@ class PaletteApp(ctk.CTk):
             
             def delete_harmony():
                 if selected_harmony[0] is None:
-                    messagebox.showwarning(self.lang.get('warning'), self.lang.get('custom_harmony_select_delete'))
+                    self._msg('warning', 'warning', 'custom_harmony_select_delete')
                     return
                 
                 if messagebox.askyesno(self.lang.get('confirm'), self.lang.get('custom_harmony_confirm_delete')):
@@ -4124,15 +4833,17 @@ class PaletteApp(ctk.CTk):
                     lbl.destroy()
                 colors_labels.clear()
                 
+                hsv_item = self.lang.get('custom_harmony_hsv_item').format
+                fixed_item = self.lang.get('custom_harmony_fixed_item').format
                 for i, color_data in enumerate(colors_list):
                     if color_data.get('type') == 'hsv':
                         h = color_data.get('h_offset', 0)
                         s = color_data.get('s_offset', 0)
                         v = color_data.get('v_offset', 0)
-                        text = self.lang.get('custom_harmony_hsv_item').format(i=i + 1, h=h, s=s, v=v)
+                        text = hsv_item(i=i + 1, h=h, s=s, v=v)
                     else:
                         hex_color = color_data.get('color', '#FFFFFF')
-                        text = self.lang.get('custom_harmony_fixed_item').format(i=i + 1, hex=hex_color)
+                        text = fixed_item(i=i + 1, hex=hex_color)
                     
                     lbl = ctk.CTkLabel(
                         colors_frame,
@@ -4241,6 +4952,10 @@ class PaletteApp(ctk.CTk):
                 preview = tk.Canvas(preview_container, height=60, bg=COLORS['bg_secondary'], highlightthickness=0)
                 preview.pack(fill='both', expand=True)
                 
+                # Single swatch item: slider moves recolor it, resizes only move its corners
+                preview_rect = preview.create_rectangle(0, 0, 450, 60, outline='')
+                preview.bind('<Configure>', lambda e: preview.coords(preview_rect, 0, 0, e.width, 60))
+                
                 def update_hsv_preview(*args):
                     try:
                         base_rgb = self.generator.hex_to_rgb(current_color)
@@ -4253,16 +4968,13 @@ class PaletteApp(ctk.CTk):
                         rgb = colorsys.hsv_to_rgb(new_h, new_s, new_v)
                         hex_color = self.generator.rgb_to_hex(tuple(int(c * 255) for c in rgb))
                         
-                        preview.delete('all')
-                        preview.update_idletasks()
-                        canvas_width = preview.winfo_width() or 450
-                        preview.create_rectangle(0, 0, canvas_width, 60, fill=hex_color, outline='')
+                        preview.itemconfigure(preview_rect, fill=hex_color)
                     except Exception:
                         pass
                 
                 for var in (h_var, s_var, v_var):
                     var.trace('w', update_hsv_preview)
-                preview.after(50, update_hsv_preview)
+                update_hsv_preview()
                 
                 # Buttons
                 btns = ctk.CTkFrame(main, fg_color="transparent")
@@ -4302,16 +5014,17 @@ class PaletteApp(ctk.CTk):
             preview_canvas = tk.Canvas(preview_canvas_frame, height=60, bg=COLORS['bg_card'], highlightthickness=0)
             preview_canvas.pack(fill='both', expand=True)
             
+            # Scratch manager for previews; its harmony list is swapped in memory
+            preview_manager = CustomHarmonyManager(self.file_handler)
+            
             def update_preview():
                 preview_canvas.delete('all')
                 if not colors_list:
                     return
                 
                 try:
-                    temp_harmony = {'name': 'Preview', 'colors': colors_list}
-                    temp_manager = CustomHarmonyManager(self.file_handler)
-                    temp_manager.harmonies = [temp_harmony]
-                    colors = temp_manager.apply_harmony(current_color, 0)
+                    preview_manager.harmonies = [{'name': 'Preview', 'colors': colors_list}]
+                    colors = preview_manager.apply_harmony(current_color, 0)
                     
                     if not colors:
                         return
@@ -4333,10 +5046,10 @@ class PaletteApp(ctk.CTk):
             def save_current_harmony():
                 name = name_var.get().strip()
                 if not name:
-                    messagebox.showwarning(self.lang.get('warning'), self.lang.get('custom_harmony_name_required'))
+                    self._msg('warning', 'warning', 'custom_harmony_name_required')
                     return
                 if not colors_list:
-                    messagebox.showwarning(self.lang.get('warning'), self.lang.get('custom_harmony_color_required'))
+                    self._msg('warning', 'warning', 'custom_harmony_color_required')
                     return
                 
                 harmony_data = {'name': name, 'colors': colors_list.copy()}
@@ -4346,7 +5059,7 @@ class PaletteApp(ctk.CTk):
                     manager.add_harmony(harmony_data)
                 
                 load_harmony_list()
-                messagebox.showinfo(self.lang.get('done'), self.lang.get('custom_harmony_saved'))
+                self._msg('info', 'done', 'custom_harmony_saved')
             
             ModernButton(bottom_frame, text=self.lang.get('button_save'), command=save_current_harmony, width=120).pack(side='left', padx=5)
             ModernSecondaryButton(bottom_frame, text=self.lang.get('button_close'), command=dialog.destroy, width=120).pack(side='right', padx=5)
@@ -4355,9 +5068,9 @@ class PaletteApp(ctk.CTk):
             load_harmony_list()
             
         except ImportError:
-            messagebox.showerror(self.lang.get('error'), self.lang.get('custom_harmony_module_missing'))
+            self._msg('error', 'error', 'custom_harmony_module_missing')
         except Exception as e:
-            messagebox.showerror(self.lang.get('error'), self.lang.get('custom_harmony_open_failed').format(error=str(e)))
+            self._msg('error', 'error', 'custom_harmony_open_failed', error=str(e))
 
     def open_ai_settings(self):
         """Open AI settings dialog"""
@@ -4467,7 +5180,7 @@ class PaletteApp(ctk.CTk):
             def test_api():
                 api_key = api_key_var.get()
                 if not api_key:
-                    messagebox.showwarning(self.lang.get('warning'), self.lang.get('ai_recommender_api_key_not_set'))
+                    self._msg('warning', 'warning', 'ai_recommender_api_key_not_set')
                     return
                 
                 try:
@@ -4475,11 +5188,11 @@ class PaletteApp(ctk.CTk):
                     recommender = AIColorRecommender(api_key, lang=self.lang)
                     result = recommender.test_api_key()
                     if result:
-                        messagebox.showinfo(self.lang.get('success'), self.lang.get('ai_api_test_success'))
+                        self._msg('info', 'success', 'ai_api_test_success')
                     else:
-                        messagebox.showerror(self.lang.get('error'), self.lang.get('ai_api_invalid_key'))
+                        self._msg('error', 'error', 'ai_api_invalid_key')
                 except Exception as e:
-                    messagebox.showerror(self.lang.get('error'), self.lang.get('ai_api_test_failed').format(error=str(e)))
+                    self._msg('error', 'error', 'ai_api_test_failed', error=str(e))
             
             ModernSecondaryButton(content, text=self.lang.get('ai_test_api'), command=test_api, width=150).pack(anchor='w', padx=15, pady=15)
             
@@ -4502,9 +5215,9 @@ class PaletteApp(ctk.CTk):
             ModernSecondaryButton(btn_frame, text=self.lang.get('button_cancel'), command=dialog.destroy, width=100).pack(side='left', padx=5)
             
         except ImportError:
-            messagebox.showerror(self.lang.get('error'), self.lang.get('ai_module_missing'))
+            self._msg('error', 'error', 'ai_module_missing')
         except Exception as e:
-            messagebox.showerror(self.lang.get('error'), self.lang.get('ai_settings_open_failed').format(error=str(e)))
+            self._msg('error', 'error', 'ai_settings_open_failed', error=str(e))
 
     def open_preset_palettes(self):
         """Open preset palettes browser"""
@@ -4512,6 +5225,7 @@ class PaletteApp(ctk.CTk):
             from preset_generator import PresetPaletteGenerator
             
             dialog = ctk.CTkToplevel(self)
+            self._scope_scroll_bindings(dialog)
             set_window_icon(dialog)
             dialog.title(self.lang.get('dialog_preset_palettes'))
             dialog.geometry("800x600")
@@ -4610,6 +5324,8 @@ class PaletteApp(ctk.CTk):
                     text=self.lang.get('preset_count').format(current=len(displayed_palettes), total=len(presets))
                 )
                 
+                tags_format = self.lang.get('preset_tags_format').format
+                use_text = self.lang.get('preset_use')
                 for i, preset in enumerate(displayed_palettes[:100]):  # Limit display for performance
                     palette_card = ctk.CTkFrame(
                         palette_scroll,
@@ -4634,7 +5350,7 @@ class PaletteApp(ctk.CTk):
                     if tags:
                         ctk.CTkLabel(
                             info_frame,
-                            text=self.lang.get('preset_tags_format').format(tags=', '.join(tags[:3])),
+                            text=tags_format(tags=', '.join(tags[:3])),
                             font=ctk.CTkFont(family=FONT_FAMILY, size=9),
                             text_color=COLORS['text_muted']
                         ).pack(side='right')
@@ -4655,23 +5371,10 @@ class PaletteApp(ctk.CTk):
                             bg=COLORS['bg_secondary'],
                             highlightthickness=0
                         )
+                        # Draw palette bar with variable width ratio once the real width is known
+                        canvas._display_colors = display_colors
+                        canvas.bind('<Configure>', self._on_palette_bar_configure)
                         canvas.pack(fill='both', expand=True)
-                        
-                        # Draw palette bar with variable width ratio
-                        def draw_preset_bar(c=canvas, cols=display_colors):
-                            c.delete('all')
-                            c.update_idletasks()
-                            canvas_width = c.winfo_width()
-                            if canvas_width <= 1:
-                                canvas_width = 700
-                            
-                            box_width = float(canvas_width) / float(len(cols))
-                            for idx, color in enumerate(cols):
-                                x1 = int(idx * box_width)
-                                x2 = int((idx + 1) * box_width)
-                                c.create_rectangle(x1, 0, x2, 30, fill=color, outline='')
-                        
-                        canvas.after(50, lambda: draw_preset_bar(canvas, display_colors))
                     
                     # Use button
                     def make_use(p):
@@ -4679,7 +5382,7 @@ class PaletteApp(ctk.CTk):
                             colors = p.get('colors', [])
                             name = p.get('name', 'Preset')
                             if colors:
-                                new_entry = {'name': name, 'colors': colors.copy()}
+                                new_entry = {'name': name, 'colors': _canon_colors(colors)}
                                 self.saved_palettes.append(new_entry)
                                 self._saved_selected = len(self.saved_palettes) - 1
                                 self.render_saved_list()
@@ -4693,7 +5396,7 @@ class PaletteApp(ctk.CTk):
                     
                     use_btn = ModernSecondaryButton(
                         palette_card,
-                        text=self.lang.get('preset_use'),
+                        text=use_text,
                         command=make_use(preset),
                         width=60,
                         height=28
@@ -4711,9 +5414,9 @@ class PaletteApp(ctk.CTk):
             ModernSecondaryButton(dialog, text=self.lang.get('close_btn'), command=dialog.destroy, width=100).pack(pady=15)
             
         except ImportError:
-            messagebox.showerror(self.lang.get('error'), self.lang.get('preset_module_missing'))
+            self._msg('error', 'error', 'preset_module_missing')
         except Exception as e:
-            messagebox.showerror(self.lang.get('error'), self.lang.get('preset_open_failed').format(error=str(e)))
+            self._msg('error', 'error', 'preset_open_failed', error=str(e))
 
     def _show_palette_selection_dialog(self, metadata):
         """Show palette selection dialog for loading palettes"""
@@ -4733,47 +5436,107 @@ class PaletteApp(ctk.CTk):
             text_color=COLORS['text_primary']
         ).pack(anchor='w', padx=15, pady=15)
         
-        # Palette list
-        list_frame = ctk.CTkScrollableFrame(dialog, fg_color=COLORS['bg_card'])
+        # Palette list: rows are drawn as items on one canvas rather than built
+        # from a frame, label and swatch frames per palette, and only the rows
+        # inside the viewport exist at any time
+        list_frame = ctk.CTkFrame(dialog, fg_color=COLORS['bg_card'])
         list_frame.pack(fill='both', expand=True, padx=15, pady=5)
         
-        selected_file = [None]
+        canvas = tk.Canvas(list_frame, bg=COLORS['bg_card'], highlightthickness=0,
+                           cursor='hand2', yscrollincrement=20)
+        scrollbar = ctk.CTkScrollbar(list_frame, command=canvas.yview)
+        scrollbar.pack(side='right', fill='y', pady=5)
+        canvas.pack(side='left', fill='both', expand=True, padx=(8, 0), pady=8)
         
-        for item in metadata:
-            name = item.get('name', 'Unknown')
-            filepath = item.get('filepath', '')
-            colors = item.get('colors', [])
-            
-            palette_btn = ctk.CTkFrame(list_frame, fg_color=COLORS['bg_secondary'], corner_radius=6)
-            palette_btn.pack(fill='x', pady=3)
-            
-            # Name
-            ctk.CTkLabel(
-                palette_btn,
-                text=name,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=11, weight="bold"),
-                text_color=COLORS['text_primary']
-            ).pack(anchor='w', padx=10, pady=(8, 2))
+        selected_file = [None]
+        row_height = 62
+        row_gap = 6
+        name_font = (FONT_FAMILY, 11, 'bold')
+        drawn_rows = set()
+        row_images = {}  # keeps each drawn row's bar PhotoImage alive
+        
+        def draw_row(i, width):
+            item = metadata[i]
+            tag = f'row{i}'
+            y = i * row_height
+            canvas.create_rectangle(0, y, width, y + row_height - row_gap,
+                                    fill=COLORS['bg_secondary'], outline='', tags=tag)
+            canvas.create_text(10, y + 8, text=item.get('name', 'Unknown'), anchor='nw',
+                               fill=COLORS['text_primary'], font=name_font, tags=tag)
             
             # Color preview
+            colors = item.get('colors', [])[:8]
             if colors:
-                bar = ctk.CTkFrame(palette_btn, height=20, fg_color="transparent")
-                bar.pack(fill='x', padx=10, pady=(0, 8))
-                bar.pack_propagate(False)
-                
-                for c in colors[:8]:
-                    swatch = ctk.CTkFrame(bar, fg_color=c, corner_radius=3)
-                    swatch.pack(side='left', fill='both', expand=True, padx=1)
-            
-            # Click to select
-            def make_select(fp):
-                def handler(e=None):
-                    selected_file[0] = fp
-                    load_selected()
-                return handler
-            
-            palette_btn.bind('<Button-1>', make_select(filepath))
-            palette_btn.configure(cursor='hand2')
+                try:
+                    row_images[i] = self._palette_bar_image(colors, width - 20, 20)
+                    canvas.create_image(10, y + 30, image=row_images[i], anchor='nw', tags=tag)
+                    return
+                except Exception:
+                    pass
+                box_width = (width - 20) / len(colors)
+                for j, c in enumerate(colors):
+                    try:
+                        canvas.create_rectangle(10 + int(j * box_width) + 1, y + 30,
+                                                10 + int((j + 1) * box_width) - 1, y + 50,
+                                                fill=c, outline='', tags=tag)
+                    except Exception:
+                        pass
+        
+        def realize_visible_rows():
+            """Draw rows that scrolled into view and drop the ones that left it"""
+            width = getattr(canvas, '_drawn_width', None)
+            if not width:
+                return
+            top = canvas.canvasy(0)
+            first = max(0, int(top // row_height))
+            last = min(len(metadata), int((top + canvas.winfo_height()) // row_height) + 1)
+            visible = set(range(first, last))
+            for i in drawn_rows - visible:
+                canvas.delete(f'row{i}')
+                row_images.pop(i, None)
+            for i in sorted(visible - drawn_rows):
+                draw_row(i, width)
+            drawn_rows.clear()
+            drawn_rows.update(visible)
+        
+        def on_yscroll(first, last):
+            scrollbar.set(first, last)
+            realize_visible_rows()
+        
+        def on_configure(e):
+            if e.width > 1 and getattr(canvas, '_drawn_width', None) != e.width:
+                # Row widths follow the canvas, so a new width redraws from scratch
+                canvas.delete('all')
+                drawn_rows.clear()
+                row_images.clear()
+                canvas._drawn_width = e.width
+                canvas.configure(scrollregion=(0, 0, e.width, len(metadata) * row_height))
+            realize_visible_rows()
+        
+        canvas.configure(yscrollcommand=on_yscroll)
+        
+        # Click to select: the row comes from the pointer's canvas y, so one binding covers all rows
+        def on_click(e):
+            y = canvas.canvasy(e.y)
+            i = int(y // row_height)
+            if 0 <= i < len(metadata) and y - i * row_height < row_height - row_gap:
+                selected_file[0] = metadata[i].get('filepath', '')
+                load_selected()
+        
+        def on_wheel(e):
+            # Scroll by the sign of the delta: macOS and precision touchpads send
+            # small deltas, and X11 sends Button-4/5 with no delta at all
+            if e.num == 4 or e.delta > 0:
+                canvas.yview_scroll(-1, 'units')
+            elif e.num == 5 or e.delta < 0:
+                canvas.yview_scroll(1, 'units')
+            return "break"
+        
+        canvas.bind('<Configure>', on_configure)
+        canvas.bind('<Button-1>', on_click)
+        canvas.bind('<MouseWheel>', on_wheel)
+        canvas.bind('<Button-4>', on_wheel)
+        canvas.bind('<Button-5>', on_wheel)
         
         def load_selected():
             if selected_file[0]:
@@ -131,13 +131,15 @@ class PaletteSharingManager:
 
         palettes = import_data['collection']['palettes']
 
+        # One import, one timestamp: format it once rather than per palette
+        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         result: list[dict[str, Any]] = []
         for palette in palettes:
             if 'colors' in palette and isinstance(palette['colors'], list):
                 result.append({
                     'name': palette.get('name', 'Imported Palette'),
                     'colors': palette['colors'],
-                    'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'timestamp': timestamp,
                 })
 
         return result
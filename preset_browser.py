@@ -6,6 +6,7 @@ UI is handled in main.py.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from preset_generator import PresetPaletteGenerator
 
@@ -28,6 +29,7 @@ class PresetPaletteService:
         return PresetPaletteGenerator.load_palettes(self.file_handler, self.data_filename)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
         hex_color = hex_color.lstrip('#')
         return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
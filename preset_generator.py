@@ -3,6 +3,7 @@ Preset Palette Generator
 Generate and manage predefined color palettes
 """
 
+import colorsys
 import random
 
 
@@ -89,7 +90,6 @@ class PresetPaletteGenerator:
     
     def generate_analogous_palette(self, base_hex):
         """Generate analogous color palette"""
-        import colorsys
         r, g, b = self.hex_to_rgb(base_hex)
         h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
         
@@ -103,7 +103,6 @@ class PresetPaletteGenerator:
     
     def generate_complementary_palette(self, base_hex):
         """Generate complementary palette"""
-        import colorsys
         r, g, b = self.hex_to_rgb(base_hex)
         h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
         
@@ -123,7 +122,6 @@ class PresetPaletteGenerator:
     
     def generate_triadic_palette(self, base_hex):
         """Generate triadic palette"""
-        import colorsys
         r, g, b = self.hex_to_rgb(base_hex)
         h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
         
@@ -321,7 +319,6 @@ class PresetPaletteGenerator:
         base_colors = ['#FF0000', '#00FF00', '#0000FF', '#FFFF00', '#FF00FF', '#00FFFF',
                        '#FF8800', '#8800FF', '#00FF88', '#FF0088', '#88FF00', '#0088FF']
         for base_hex in base_colors:
-            import colorsys
             r, g, b = self.hex_to_rgb(base_hex)
             h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
             colors = []